@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Optional, ClassVar, Any, TYPE_CHECKING
 from enum import Enum
 import asyncio
+import copy
 
 import discord
 from discord.ext import commands
@@ -12,7 +13,9 @@ from akinator import (
     CantGoBackAnyFurther,
 )
 
-from .utils import DiscordColor, DEFAULT_COLOR, Player, double_wait
+from .utils import DiscordColor, DEFAULT_COLOR, Player
+from .dispatcher import GameDispatcher
+from .aki_session import AkinatorSession, get_akinator_session
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 BACK = "◀️"
 STOP = "⏹️"
 
+UPSTREAM_ERROR = "Akinator is not responding right now, try again in a moment"
+
 
 class Options(Enum):
     yes = "✅"
@@ -34,8 +39,12 @@ class Akinator:
 
     The bot asks yes/no questions and tries to guess
     the character the player is thinking of.
+    Requests go through the shared :class:`AkinatorSession` unless ``session`` is given.
     """
 
+    # the answers prefetched in speculative mode, by far the most common ones
+    SPECULATIVE_ANSWERS: ClassVar[tuple[str, ...]] = ("yes", "no")
+
     BAR: ClassVar[str] = "██"
     DEFAULT_INSTRUCTIONS: ClassVar[str] = (
         "✅ 🠒 `yes`\n"
@@ -45,8 +54,8 @@ class Akinator:
         "😕 🠒 `probably not`\n"
     )
 
-    def __init__(self) -> None:
-        self.aki: AkinatorGame = AkinatorGame()
+    def __init__(self, *, session: Optional[AkinatorSession] = None) -> None:
+        self.aki: AkinatorGame = AkinatorGame(session=session or get_akinator_session())
 
         self.player: Optional[Player] = None
         self.win_at: Optional[int] = None
@@ -57,8 +66,61 @@ class Akinator:
         self.back_button: bool = False
         self.delete_button: bool = False
         self.instructions: str = self.DEFAULT_INSTRUCTIONS
+        self.speculative: bool = False
 
         self.bar: str = ""
+        self._prefetched: dict[str, asyncio.Task[AkinatorGame]] = {}
+
+    @staticmethod
+    async def _answer_on(aki: AkinatorGame, answer: str) -> AkinatorGame:
+        await aki.answer(answer)
+        return aki
+
+    def prefetch(self) -> None:
+        """
+        in speculative mode, starts answering the current question with each of
+        :attr:`SPECULATIVE_ANSWERS` on copies of the game, while the player is still reading it
+        """
+        self.cancel_prefetch()
+        if not self.speculative or self.aki.win or self.aki.finished:
+            return
+        if self.win_at is not None and self.aki.progression >= self.win_at:  # type: ignore[operator]
+            return
+
+        for answer in self.SPECULATIVE_ANSWERS:
+            # a shallow copy shares the session but answers into its own state
+            clone = copy.copy(self.aki)
+            self._prefetched[answer] = asyncio.create_task(
+                self._answer_on(clone, answer)
+            )
+
+    def cancel_prefetch(self) -> None:
+        """drops every prefetched answer"""
+        for task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+
+    async def answer(self, answer: str) -> None:
+        """
+        answers the current question, adopting the prefetched game if this answer was speculated on
+
+        Parameters
+        ----------
+        answer : str
+            the player's answer
+        """
+        task = self._prefetched.pop(answer, None)
+        self.cancel_prefetch()
+
+        if task is not None:
+            try:
+                self.aki = await task
+                return
+            except RuntimeError:
+                # the speculative request failed, so the answer is sent again for real
+                pass
+
+        await self.aki.answer(answer)
 
     def build_bar(self) -> str:
         prog = round(self.aki.progression / 8)  # type: ignore[operator]
@@ -115,6 +177,7 @@ class Akinator:
         aki_theme: Literal["c", "a", "o"] = "c",
         aki_language: str = "en",
         child_mode: bool = True,
+        speculative: bool = False,
     ) -> Optional[discord.Message]:
         """
         starts the akinator game
@@ -141,6 +204,9 @@ class Akinator:
             the language code (e.g. "en", "fr", "es") or full name (e.g. "english"), by default "en"
         child_mode : bool, optional
             indicates to filter out NSFW content or not, by default True
+        speculative : bool, optional
+            indicates whether to prefetch the next question for the most likely answers
+            while the player is reading the current one, by default False
 
         Returns
         -------
@@ -153,6 +219,7 @@ class Akinator:
         self.embed_color = embed_color
         self.player = ctx.author
         self.win_at = win_at
+        self.speculative = speculative
 
         if self.back_button:
             self.instructions += f"{BACK} 🠒 `back`\n"
@@ -168,6 +235,7 @@ class Akinator:
 
         embed = self.build_embed()
         self.message = await ctx.send(embed=embed)
+        self.prefetch()
 
         for button in Options:
             await self.message.add_reaction(button.value)
@@ -194,12 +262,15 @@ class Akinator:
                 return False
 
             try:
-                done, _ = await double_wait(
-                    ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-                    ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+                reaction, user = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+                    message=self.message.id,
+                    user=ctx.author.id,
+                    check=check,
+                    timeout=timeout,
+                    remove=True,
                 )
-                reaction, user = done.pop().result()
             except asyncio.TimeoutError:
+                self.cancel_prefetch()
                 return
 
             if remove_reaction_after:
@@ -211,21 +282,29 @@ class Akinator:
             emoji = str(reaction.emoji)
 
             if emoji == STOP:
+                self.cancel_prefetch()
                 await ctx.send("**Session ended**")
                 return await self.message.delete()
 
-            if emoji == BACK:
-                try:
+            try:
+                if emoji == BACK:
+                    self.cancel_prefetch()
                     await self.aki.back()
-                except CantGoBackAnyFurther:
-                    await self.message.reply(
-                        "I cannot go back any further", delete_after=10
-                    )
-            else:
-                await self.aki.answer(Options(emoji).name)
+                else:
+                    await self.answer(Options(emoji).name)
+            except CantGoBackAnyFurther:
+                await self.message.reply(
+                    "I cannot go back any further", delete_after=10
+                )
+            except RuntimeError:
+                # the request failed even after retrying, the answer can simply be given again
+                await self.message.reply(UPSTREAM_ERROR, delete_after=10)
+                self.prefetch()
+                continue
 
             embed = self.build_embed()
             await self.message.edit(embed=embed)
+            self.prefetch()
 
         embed = await self.win()
         return await self.message.edit(embed=embed)
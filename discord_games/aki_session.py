@@ -0,0 +1,219 @@
+"""A shared, bounded transport for the Akinator games.
+
+:class:`akinator.AsyncAkinator` posts every request through the session it is given.
+:class:`AkinatorSession` is one such session shared by every game, so that the
+underlying connection pool and any solved Cloudflare challenge are reused.
+Each request is bounded by a timeout and retried with jittered exponential backoff,
+and the latency of every endpoint is recorded in :attr:`AkinatorSession.stats`.
+
+The upstream keeps the state of every game, so a request is only retried when it cannot
+have been processed: the connection was never established, or the upstream turned it away
+with one of :data:`RETRY_STATUSES`. A timed out request may still reach the upstream,
+so only the endpoints in :data:`REPLAYABLE_ENDPOINTS` are retried after a timeout;
+those are delivered at least once, every other request at most once.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Final, Optional
+from urllib.parse import urlsplit
+import asyncio
+import random
+import time
+
+import requests
+from cloudscraper import CloudScraper, create_scraper
+from urllib3.exceptions import ConnectTimeoutError
+
+__all__: tuple[str, ...] = (
+    "LatencyStats",
+    "AkinatorSession",
+    "get_akinator_session",
+    "set_akinator_session",
+)
+
+# responses worth retrying, the upstream being overloaded or briefly unavailable
+RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+# endpoints that are harmless to send twice, starting a game only creates a new session upstream
+REPLAYABLE_ENDPOINTS: Final[frozenset[str]] = frozenset({"game"})
+
+_session: Optional[AkinatorSession] = None
+
+
+class LatencyStats:
+    """The latencies of the requests made to one endpoint, in seconds."""
+
+    __slots__ = ("count", "failures", "retries", "total", "max", "last")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.failures: int = 0
+        self.retries: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.last: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<LatencyStats count={self.count} mean={self.mean:.3f} max={self.max:.3f} "
+            f"failures={self.failures} retries={self.retries}>"
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.last = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+
+class AkinatorSession:
+    """An HTTP session for :class:`akinator.AsyncAkinator` with timeouts, retries and metrics.
+
+    Obtain the shared session through :func:`get_akinator_session`.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        the number of seconds a single attempt may take, by default 10.0
+    retries : int, optional
+        the number of times a failed request is retried, by default 2
+    backoff : float, optional
+        the base delay between retries in seconds, doubled after each attempt
+        and jittered by up to 50% either way, by default 0.5
+    base_url : Optional[str], optional
+        redirects every request to this url, the language subdomain becoming the first path segment,
+        e.g. a local stub server, by default None
+    scraper : Optional[CloudScraper], optional
+        the scraper to send requests with, by default a new one
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        base_url: Optional[str] = None,
+        scraper: Optional[CloudScraper] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.scraper: CloudScraper = scraper or create_scraper()
+
+        self.stats: dict[str, LatencyStats] = {}
+
+    def __repr__(self) -> str:
+        return f"<AkinatorSession timeout={self.timeout} retries={self.retries} endpoints={len(self.stats)}>"
+
+    def _resolve(self, url: str) -> tuple[str, str]:
+        parts = urlsplit(url)
+        endpoint = parts.path.strip("/") or "/"
+        if self.base_url is None:
+            return url, endpoint
+
+        language = parts.hostname.split(".", 1)[0] if parts.hostname else ""
+        return f"{self.base_url}/{language}{parts.path}", endpoint
+
+    def _send(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.scraper.post(url, timeout=self.timeout, **kwargs)
+
+    @staticmethod
+    def _never_sent(error: BaseException) -> bool:
+        # requests wraps the urllib3 error of a connection that could not be established,
+        # NewConnectionError included, as the reason of a MaxRetryError
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        if isinstance(error, requests.ConnectionError) and error.args:
+            reason = getattr(error.args[0], "reason", error.args[0])
+            return isinstance(reason, ConnectTimeoutError)
+        return False
+
+    async def post(
+        self, url: str, data: Any = None, json: Any = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        sends a POST request, retrying it if it was never sent or the upstream was overloaded,
+        and after a timeout for the endpoints in :data:`REPLAYABLE_ENDPOINTS` only
+
+        Returns
+        -------
+        requests.Response
+            the response, which may still be an error once the retries ran out
+
+        Raises
+        ------
+        requests.RequestException
+            the request failed on every attempt, or failed once it may have been sent
+        asyncio.TimeoutError
+            the request timed out, on its last attempt for the replayable endpoints
+        """
+        url, endpoint = self._resolve(url)
+        stats = self.stats.setdefault(endpoint, LatencyStats())
+        replayable = endpoint in REPLAYABLE_ENDPOINTS
+
+        error: Optional[BaseException] = None
+        response: Optional[requests.Response] = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                stats.retries += 1
+                delay = self.backoff * 2 ** (attempt - 1)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+            start = time.perf_counter()
+            try:
+                # the scraper is blocking, its own timeout applies per socket operation,
+                # so the attempt as a whole is bounded here as well
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(self._send, url, data=data, json=json, **kwargs),
+                    self.timeout,
+                )
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                asyncio.TimeoutError,
+            ) as e:
+                stats.failures += 1
+                # the request may have been processed, and the worker thread may even still deliver it
+                if not (replayable or self._never_sent(e)):
+                    raise
+                error, response = e, None
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    stats.record(time.perf_counter() - start)
+                    return response
+                stats.failures += 1
+
+        if response is not None:
+            return response
+        assert error is not None
+        raise error
+
+
+def get_akinator_session() -> AkinatorSession:
+    """returns the session shared by every akinator game, creating it on first use"""
+    global _session
+    if _session is None:
+        _session = AkinatorSession()
+    return _session
+
+
+def set_akinator_session(session: Optional[AkinatorSession]) -> None:
+    """
+    sets the session shared by every akinator game created afterwards,
+    passing None makes a default one be created again on first use
+
+    Parameters
+    ----------
+    session : Optional[AkinatorSession]
+        the session to share, e.g. one with other timeouts or pointed at a stub server
+    """
+    global _session
+    _session = session
@@ -1,24 +1,28 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union, ClassVar
+from typing import TYPE_CHECKING, Optional, Union, ClassVar, Final
 from io import BytesIO
 import asyncio
+import functools
 import pathlib
 import random
 import re
+import threading
 
 import discord
 from discord.ext import commands
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
 
 from .utils import DiscordColor, Player, executor
+from .dispatcher import GameDispatcher
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
     Coords: TypeAlias = tuple[int, int]
+    Fleet: TypeAlias = dict[str, tuple[int, tuple[int, int, int]]]
 
-SHIPS: dict[str, tuple[int, tuple[int, int, int]]] = {
+SHIPS: Fleet = {
     "carrier": (5, (52, 152, 219)),
     "battleship": (4, (246, 246, 112)),
     "destroyer": (3, (14, 146, 150)),
@@ -26,6 +30,76 @@ SHIPS: dict[str, tuple[int, tuple[int, int, int]]] = {
     "patrol boat": (2, (190, 190, 190)),
 }
 
+DEFAULT_SIZE: Final[int] = 10
+MAX_SIZE: Final[int] = 20
+
+# the number of whole-fleet placements to attempt before giving up
+PLACEMENT_ATTEMPTS: Final[int] = 100
+
+RED: Final[tuple[int, int, int]] = (255, 0, 0)
+GRAY: Final[tuple[int, int, int]] = (128, 128, 128)
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+
+
+@functools.lru_cache(maxsize=4)
+def _background(size: int = DEFAULT_SIZE) -> Image.Image:
+    if size == DEFAULT_SIZE:
+        with Image.open(ASSETS / "battleship.png") as img:
+            img.load()
+            return img.copy()
+
+    # other sizes are drawn in the style of the bundled 10x10 asset
+    length = (size + 2) * 50
+    img = Image.new("RGBA", (length, length), (40, 40, 40, 255))
+    cur = ImageDraw.Draw(img)
+    font = ImageFont.truetype(str(ASSETS / "segoe-ui-semilight-411.ttf"), 20)
+
+    end = 50 + size * 50
+    for i in range(size + 1):
+        cur.line((50 + i * 50, 50, 50 + i * 50, end), fill=(255, 255, 255))
+        cur.line((50, 50 + i * 50, end, 50 + i * 50), fill=(255, 255, 255))
+
+    for i in range(size):
+        cur.text((75 + i * 50, 35), str(i + 1), font=font, anchor="mm")
+        cur.text((25, 85 + i * 50), chr(65 + i), font=font, anchor="mm")
+    return img
+
+
+@functools.lru_cache(maxsize=32)
+def _placements(size: int, length: int) -> tuple[tuple[int, Coords, bool], ...]:
+    """every (cell mask, start, vertical) a ship of the given length can take on an empty board"""
+    placements: list[tuple[int, Coords, bool]] = []
+    for x in range(1, size + 1):
+        for y in range(1, size + 1):
+            for vertical in (False, True):
+                if (y if vertical else x) + length - 1 > size:
+                    continue
+
+                mask = 0
+                for k in range(length):
+                    coord = (x, y + k) if vertical else (x + k, y)
+                    mask |= 1 << ((coord[0] - 1) * size + coord[1] - 1)
+                placements.append((mask, (x, y), vertical))
+    return tuple(placements)
+
+
+def _cell_center(coord: Coords) -> tuple[int, int]:
+    return 25 + coord[1] * 50, 25 + coord[0] * 50
+
+
+class _Layer:
+    """A board image along with how much of the board state has been drawn onto it"""
+
+    __slots__ = ("image", "ships", "hits", "misses", "png")
+
+    def __init__(self, size: int) -> None:
+        self.image: Image.Image = _background(size).copy()
+        self.ships: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.png: Optional[bytes] = None
+
 
 class Ship:
     def __init__(
@@ -57,12 +131,28 @@ class Ship:
 
         self.hits: list[bool] = [False] * self.size
 
+    def offset(self, coord: Coords) -> int:
+        """returns the index of the coordinate within :attr:`span`"""
+        if self.vertical:
+            return coord[1] - self.start[1]
+        return coord[0] - self.start[0]
+
 
 class Board:
     def __init__(
-        self, player: Player, random: bool = True
+        self,
+        player: Player,
+        random: bool = True,
+        *,
+        size: int = DEFAULT_SIZE,
+        fleet: Optional[Fleet] = None,
     ) -> None:
+        if not 1 <= size <= MAX_SIZE:
+            raise ValueError(f"Board size must be between 1 and {MAX_SIZE}")
+
         self.player: Player = player
+        self.size: int = size
+        self.fleet: Fleet = fleet or SHIPS
         self.ships: list[Ship] = []
 
         self.my_hits: list[Coords] = []
@@ -71,45 +161,96 @@ class Board:
         self.op_hits: list[Coords] = []
         self.op_misses: list[Coords] = []
 
+        # every cell maps to the index of the ship occupying it, or -1
+        self.grid: list[int] = [-1] * (size * size)
+        self._moves: set[Coords] = set()
+        self._afloat: int = 0
+
+        # cached images for the owner's view (False) and the opponent's view (True)
+        self._layers: dict[bool, _Layer] = {}
+        self._lock = threading.Lock()
+
         if random:
             self._place_ships()
 
     @property
-    def moves(self) -> list[Coords]:
-        return self.my_hits + self.my_misses
+    def moves(self) -> set[Coords]:
+        return self._moves
+
+    def _cell(self, coord: Coords) -> int:
+        return (coord[0] - 1) * self.size + coord[1] - 1
+
+    def in_bounds(self, coord: Coords) -> bool:
+        return 1 <= coord[0] <= self.size and 1 <= coord[1] <= self.size
 
     def _is_valid(self, ship: Ship) -> bool:
-        if ship.end[0] > 10 or ship.end[1] > 10:
+        if not (self.in_bounds(ship.start) and self.in_bounds(ship.end)):
             return False
 
-        for existing in self.ships:
-            if any(c in existing.span for c in ship.span):
-                return False
-        return True
+        return all(self.grid[self._cell(coord)] == -1 for coord in ship.span)
+
+    def add_ship(self, ship: Ship) -> None:
+        index = len(self.ships)
+        self.ships.append(ship)
+        self._afloat += ship.size
+
+        for coord in ship.span:
+            self.grid[self._cell(coord)] = index
+
+    def receive_shot(self, coords: Coords) -> Optional[Ship]:
+        """records an opponent's shot, returning the ship it hit if any"""
+        if ship := self.get_ship(coords):
+            offset = ship.offset(coords)
+            if not ship.hits[offset]:
+                ship.hits[offset] = True
+                self._afloat -= 1
+            self.op_hits.append(coords)
+        else:
+            self.op_misses.append(coords)
+        return ship
+
+    def record_move(self, coords: Coords, *, hit: bool) -> None:
+        """records a shot made by this board's player"""
+        (self.my_hits if hit else self.my_misses).append(coords)
+        self._moves.add(coords)
 
     def _place_ships(self) -> None:
-        def place_ship(ship: str, size: int, color: tuple[int, int, int]) -> None:
-            start = random.randint(1, 10), random.randint(1, 10)
-            vertical = bool(random.randint(0, 1))
-
-            new_ship = Ship(
-                name=ship,
-                size=size,
-                start=start,
-                vertical=vertical,
-                color=color,
-            )
+        # larger ships first, as they have the fewest places left to go
+        fleet = sorted(self.fleet.items(), key=lambda item: item[1][0], reverse=True)
+
+        for _ in range(PLACEMENT_ATTEMPTS):
+            occupied = 0
+            chosen: list[tuple[str, int, tuple[int, int, int], Coords, bool]] = []
 
-            if self._is_valid(new_ship):
-                self.ships.append(new_ship)
+            for ship, (size, color) in fleet:
+                free = [p for p in _placements(self.size, size) if not p[0] & occupied]
+                if not free:
+                    break
+
+                mask, start, vertical = random.choice(free)
+                occupied |= mask
+                chosen.append((ship, size, color, start, vertical))
             else:
-                place_ship(ship, size, color)
+                # keep the fleet's own order for the board's ship indices
+                order = list(self.fleet)
+                chosen.sort(key=lambda c: order.index(c[0]))
+
+                for ship, size, color, start, vertical in chosen:
+                    self.add_ship(
+                        Ship(
+                            name=ship,
+                            size=size,
+                            start=start,
+                            vertical=vertical,
+                            color=color,
+                        )
+                    )
+                return
 
-        for ship, (size, color) in SHIPS.items():
-            place_ship(ship, size, color)
+        raise ValueError("The fleet does not fit on the board")
 
     def won(self) -> bool:
-        return all(all(ship.hits) for ship in self.ships)
+        return self._afloat == 0
 
     def draw_dot(
         self,
@@ -126,8 +267,9 @@ class Board:
         self, cur: ImageDraw.ImageDraw, x: int, y: int, *, coord: Coords, ship: Ship
     ) -> None:
         vertical = ship.vertical
-        left_end = ship.span.index(coord) == 0
-        right_end = ship.span.index(coord) == ship.size - 1
+        offset = ship.offset(coord)
+        left_end = offset == 0
+        right_end = offset == ship.size - 1
 
         if vertical and left_end:
             diffs = (18, 18, 25, 18)
@@ -148,41 +290,55 @@ class Board:
         cur.rounded_rectangle((x1, y1, x2, y2), radius=5, fill=ship.color)
 
     def get_ship(self, coord: Coords) -> Optional[Ship]:
-        if s := [ship for ship in self.ships if coord in ship.span]:
-            return s[0]
+        if not self.in_bounds(coord):
+            return None
+
+        index = self.grid[self._cell(coord)]
+        return self.ships[index] if index != -1 else None
+
+    def _update_layer(self, hide: bool) -> _Layer:
+        layer = self._layers.get(hide)
+        if layer is None:
+            layer = self._layers[hide] = _Layer(self.size)
+
+        ships = self.ships[layer.ships :]
+        hits = self.op_hits[layer.hits :]
+        misses = self.op_misses[layer.misses :]
+
+        if (ships and not hide) or hits or misses:
+            cur = ImageDraw.Draw(layer.image)
+
+            if not hide:
+                for ship in ships:
+                    for coord in ship.span:
+                        x, y = _cell_center(coord)
+                        self.draw_sq(cur, x, y, coord=coord, ship=ship)
+
+            for coord in misses:
+                self.draw_dot(cur, *_cell_center(coord), fill=GRAY)
+
+            # the hit ship is already drawn in the unhidden layer
+            for coord in hits:
+                self.draw_dot(cur, *_cell_center(coord), fill=RED)
+
+            layer.png = None
+
+        layer.ships = len(self.ships)
+        layer.hits = len(self.op_hits)
+        layer.misses = len(self.op_misses)
+        return layer
 
     @executor()
     def to_image(self, hide: bool = False) -> BytesIO:
-        RED = (255, 0, 0)
-        GRAY = (128, 128, 128)
-
-        with Image.open(pathlib.Path(__file__).parent / "assets/battleship.png") as img:
-            cur = ImageDraw.Draw(img)
-
-            for i, y in zip(range(1, 11), range(75, 530, 50)):
-                for j, x in zip(range(1, 11), range(75, 530, 50)):
-                    coord = (i, j)
-                    if coord in self.op_misses:
-                        self.draw_dot(cur, x, y, fill=GRAY)
-
-                    elif coord in self.op_hits:
-                        if hide:
-                            self.draw_dot(cur, x, y, fill=RED)
-                        else:
-                            hit_ship = self.get_ship(coord)
-                            if hit_ship is not None:
-                                self.draw_sq(cur, x, y, coord=coord, ship=hit_ship)
-                            self.draw_dot(cur, x, y, fill=RED)
-
-                    elif ship := self.get_ship(coord):
-                        if not hide:
-                            self.draw_sq(cur, x, y, coord=coord, ship=ship)
-            buffer = BytesIO()
-            img.save(buffer, "PNG")
-
-        buffer.seek(0)
-        del img
-        return buffer
+        with self._lock:
+            layer = self._update_layer(hide)
+
+            if layer.png is None:
+                buffer = BytesIO()
+                layer.image.save(buffer, "PNG")
+                layer.png = buffer.getvalue()
+
+        return BytesIO(layer.png)
 
 
 class BattleShip:
@@ -200,6 +356,8 @@ class BattleShip:
         player2: Player,
         *,
         random: bool = True,
+        size: int = DEFAULT_SIZE,
+        fleet: Optional[Fleet] = None,
     ) -> None:
         self.embed_color: Optional[DiscordColor] = None
 
@@ -207,9 +365,19 @@ class BattleShip:
         self.player2: Player = player2
 
         self.random: bool = random
+        self.size: int = size
+        self.fleet: Fleet = fleet or SHIPS
 
-        self.player1_board: Board = Board(player1, random=self.random)
-        self.player2_board: Board = Board(player2, random=self.random)
+        if size != DEFAULT_SIZE:
+            numbers = "|".join(str(n) for n in range(size, 0, -1))
+            self.inputpat = re.compile(rf"([a-{chr(96 + size)}])({numbers})")
+
+        self.player1_board: Board = Board(
+            player1, random=self.random, size=size, fleet=self.fleet
+        )
+        self.player2_board: Board = Board(
+            player2, random=self.random, size=size, fleet=self.fleet
+        )
 
         self.turn: Player = self.player1
         self.timeout: Optional[float] = None
@@ -231,16 +399,11 @@ class BattleShip:
         board = self.get_board(player)
         op_board = self.get_board(player, other=True)
 
-        for i, ship in enumerate(op_board.ships):
-            for j, coord in enumerate(ship.span):
-                if coords == coord:
-                    op_board.ships[i].hits[j] = True
-                    board.my_hits.append(coords)
-                    op_board.op_hits.append(coords)
-                    return all(op_board.ships[i].hits), True
+        ship = op_board.receive_shot(coords)
+        board.record_move(coords, hit=ship is not None)
 
-        board.my_misses.append(coords)
-        op_board.op_misses.append(coords)
+        if ship is not None:
+            return all(ship.hits), True
         return False, False
 
     async def get_file(
@@ -289,67 +452,75 @@ class BattleShip:
         board = self.get_board(user)
 
         async def place_ship(ship: str, size: int, color: tuple[int, int, int]) -> bool:
-            embed, file, _, _ = await self.get_file(user)
-            await user.send(
-                f"Where do you want to place your `{ship}`?\nSend the start coordinate... e.g. (`a1`)",
-                embed=embed,
-                file=file,
-            )
-
-            def check(msg: discord.Message) -> bool:
-                if not msg.guild and msg.author == user:
-                    content = re.sub(r"\s+", "", msg.content).lower()
-                    return bool(self.inputpat.match(content))
-                return False
-
-            try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", check=check, timeout=self.timeout
-                )
-            except asyncio.TimeoutError:
+            while True:
+                embed, file, _, _ = await self.get_file(user)
                 await user.send(
-                    f"The timeout of {self.timeout} seconds, has been reached. Aborting..."
+                    f"Where do you want to place your `{ship}`?\nSend the start coordinate... e.g. (`a1`)",
+                    embed=embed,
+                    file=file,
                 )
-                return False
 
-            _, start = self.get_coords(message.content)
+                def check(msg: discord.Message) -> bool:
+                    if not msg.guild and msg.author == user:
+                        content = re.sub(r"\s+", "", msg.content).lower()
+                        return bool(self.inputpat.match(content))
+                    return False
+
+                try:
+                    message: discord.Message = await GameDispatcher.get(
+                        ctx.bot
+                    ).wait_for_message(
+                        author=user.id,
+                        check=check,
+                        timeout=self.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    await user.send(
+                        f"The timeout of {self.timeout} seconds, has been reached. Aborting..."
+                    )
+                    return False
 
-            await user.send("Do you want it to be vertical?\nSay `yes` or `no`")
+                _, start = self.get_coords(message.content)
 
-            def check_vertical(msg: discord.Message) -> bool:
-                if not msg.guild and msg.author == user:
-                    content = msg.content.replace(" ", "").lower()
-                    return content in ("yes", "no")
-                return False
+                await user.send("Do you want it to be vertical?\nSay `yes` or `no`")
 
-            try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", check=check_vertical, timeout=self.timeout
-                )
-            except asyncio.TimeoutError:
-                await user.send(
-                    f"The timeout of {self.timeout} seconds, has been reached. Aborting..."
-                )
-                return False
+                def check_vertical(msg: discord.Message) -> bool:
+                    if not msg.guild and msg.author == user:
+                        content = msg.content.replace(" ", "").lower()
+                        return content in ("yes", "no")
+                    return False
+
+                try:
+                    message: discord.Message = await GameDispatcher.get(
+                        ctx.bot
+                    ).wait_for_message(
+                        author=user.id,
+                        check=check_vertical,
+                        timeout=self.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    await user.send(
+                        f"The timeout of {self.timeout} seconds, has been reached. Aborting..."
+                    )
+                    return False
 
-            vertical = message.content.replace(" ", "").lower() == "yes"
+                vertical = message.content.replace(" ", "").lower() == "yes"
 
-            new_ship = Ship(
-                name=ship,
-                size=size,
-                start=start,
-                vertical=vertical,
-                color=color,
-            )
+                new_ship = Ship(
+                    name=ship,
+                    size=size,
+                    start=start,
+                    vertical=vertical,
+                    color=color,
+                )
 
-            if board._is_valid(new_ship):
-                board.ships.append(new_ship)
-                return True
-            else:
-                await user.send("That is a not a valid location, please try again")
-                return await place_ship(ship, size, color)
+                if board._is_valid(new_ship):
+                    board.add_ship(new_ship)
+                    return True
+                else:
+                    await user.send("That is a not a valid location, please try again")
 
-        for ship, (size, color) in SHIPS.items():
+        for ship, (size, color) in self.fleet.items():
             await place_ship(ship, size, color)
 
         await user.send("All setup! (Game will soon start after the opponent finishes)")
@@ -398,8 +569,12 @@ class BattleShip:
                 return False
 
             try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", check=check, timeout=self.timeout
+                message: discord.Message = await GameDispatcher.get(
+                    ctx.bot
+                ).wait_for_message(
+                    author=self.turn.id,
+                    check=check,
+                    timeout=self.timeout,
                 )
             except asyncio.TimeoutError:
                 await ctx.send(
@@ -6,7 +6,7 @@ import discord
 from discord.ext import commands
 from akinator import CantGoBackAnyFurther
 
-from ..aki import Akinator
+from ..aki import Akinator, UPSTREAM_ERROR
 from ..utils import DiscordColor, DEFAULT_COLOR, BaseView
 
 if TYPE_CHECKING:
@@ -58,6 +58,7 @@ class AkiView(BaseView):
             return
 
         if answer == "cancel":
+            game.cancel_prefetch()
             assert interaction.message is not None
             await interaction.message.reply("Session ended", mention_author=True)
             self.stop()
@@ -67,18 +68,25 @@ class AkiView(BaseView):
         # defer to avoid 3s interaction timeout while waiting for the akinator API
         await interaction.response.defer()
 
-        if answer == "back":
-            try:
+        try:
+            if answer == "back":
+                game.cancel_prefetch()
                 await game.aki.back()
-                embed = game.build_embed(instructions=False)
-            except CantGoBackAnyFurther:
-                await interaction.followup.send(
-                    "I cant go back any further!", ephemeral=True
-                )
-                return
-        else:
-            await game.aki.answer(answer)
+            else:
+                await game.answer(answer)
+        except CantGoBackAnyFurther:
+            await interaction.followup.send(
+                "I cant go back any further!", ephemeral=True
+            )
+            return
+        except RuntimeError:
+            await interaction.followup.send(UPSTREAM_ERROR, ephemeral=True)
+            game.prefetch()
+            return
 
+        if answer == "back":
+            embed = game.build_embed(instructions=False)
+        else:
             if game.win_at is not None and game.aki.progression >= game.win_at:  # type: ignore[operator]
                 self.disable_all()
                 embed = await game.win()
@@ -89,6 +97,7 @@ class AkiView(BaseView):
             await interaction.edit_original_response(embed=embed, view=self)
         except discord.NotFound:
             pass
+        game.prefetch()
 
 
 class BetaAkinator(Akinator):
@@ -110,6 +119,7 @@ class BetaAkinator(Akinator):
         aki_theme: Literal["c", "a", "o"] = "c",
         aki_language: str = "en",
         child_mode: bool = True,
+        speculative: bool = False,
     ) -> discord.Message:
         """
         starts the Akinator(buttons) game
@@ -134,6 +144,9 @@ class BetaAkinator(Akinator):
             the language code (e.g. "en", "fr", "es") or full name (e.g. "english"), by default "en"
         child_mode : bool, optional
             indicates to filter out NSFW content or not, by default True
+        speculative : bool, optional
+            indicates whether to prefetch the next question for the most likely answers
+            while the player is reading the current one, by default False
 
         Returns
         -------
@@ -146,6 +159,7 @@ class BetaAkinator(Akinator):
 
         self.player = ctx.author
         self.win_at = win_at
+        self.speculative = speculative
         self.view = AkiView(self, timeout=timeout)
 
         await self.aki.start_game(
@@ -157,6 +171,8 @@ class BetaAkinator(Akinator):
         embed = self.build_embed(instructions=False)
         self.message = await ctx.send(embed=embed, view=self.view)
         self.view.message = self.message
+        self.prefetch()
 
         await self.view.wait()
+        self.cancel_prefetch()
         return self.message
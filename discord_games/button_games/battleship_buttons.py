@@ -9,7 +9,7 @@ from discord.ext import commands
 
 from ..battleship import (
     BattleShip,
-    SHIPS,
+    DEFAULT_SIZE,
     Ship,
     Board,
 )
@@ -200,20 +200,22 @@ class BattleshipView(BaseView):
 
     def initialize_view(self, *, clear: bool = False, start: bool = False) -> None:
         moves = self.player_board.moves
+        size = self.player_board.size
 
         if clear:
             self.clear_items()
-            for num in range(1, 11):
+            for num in range(1, size + 1):
                 button = CoordButton(num)
                 coord = (self.game.to_num(self.alpha or ""), num)
                 if coord in moves:
                     button.disabled = True
                 self.add_item(button)
         else:
-            for letter in string.ascii_uppercase[:10]:
+            for letter in string.ascii_uppercase[:size]:
                 button = CoordButton(letter)
                 if all(
-                    (self.game.to_num(letter.lower()), i) in moves for i in range(1, 11)
+                    (self.game.to_num(letter.lower()), i) in moves
+                    for i in range(1, size + 1)
                 ):
                     button.disabled = True
                 self.add_item(button)
@@ -292,7 +294,7 @@ class SetupInput(discord.ui.Modal):
 
         if board._is_valid(new_ship):
             self.button.disabled = True
-            board.ships.append(new_ship)
+            board.add_ship(new_ship)
 
             embed, file, _, _ = await game.get_file(interaction.user, hide=False)  # type: ignore[arg-type]
 
@@ -338,7 +340,7 @@ class SetupView(BaseView):
 
         self.game = game
 
-        for ship, (size, color) in SHIPS.items():
+        for ship, (size, color) in game.fleet.items():
             self.add_item(SetupButton(ship, size, color))
 
 
@@ -357,8 +359,10 @@ class BetaBattleShip(BattleShip):
         player2: PlayerType,
         *,
         random: bool = True,
+        size: int = DEFAULT_SIZE,
+        fleet: Optional[dict[str, tuple[int, tuple[int, int, int]]]] = None,
     ) -> None:
-        super().__init__(player1, player2, random=random)  # type: ignore[arg-type]
+        super().__init__(player1, player2, random=random, size=size, fleet=fleet)  # type: ignore[arg-type]
 
         self.player1: Player = Player(player1, game=self)  # type: ignore[assignment]
         self.player2: Player = Player(player2, game=self)  # type: ignore[assignment]
@@ -5,9 +5,9 @@ import random
 
 import discord
 from discord.ext import commands
-from english_words import get_english_words_set
 
 from ..utils import BaseView, DiscordColor, DEFAULT_COLOR, Player, chunk
+from ..lexicon import Lexicon, get_lexicon
 
 
 class BoggleButton(discord.ui.Button["BoggleView"]):
@@ -160,11 +160,7 @@ class Boggle:
     )
 
     def __init__(self) -> None:
-        self.words: set[str] = get_english_words_set(
-            ["web2"],
-            alpha=True,
-            lower=True,
-        )
+        self.words: Lexicon = get_lexicon("web2")
         self.board = self.generate_board()
 
         self.button_style: discord.ButtonStyle = discord.ButtonStyle.gray
@@ -55,14 +55,31 @@ class ChessInput(discord.ui.Modal, title="Make your move"):
         else:
             await game.place_move(uci)
 
-            if game.board.is_game_over():
+            if status := game.board.is_game_over():
                 self.view.disable_all()
                 embed = await game.fetch_results()
                 self.view.stop()
             else:
                 embed = await game.make_embed()
 
-            await interaction.response.edit_message(embed=embed, view=self.view)
+            file = await game.get_board_file()
+            await interaction.response.edit_message(
+                embed=embed, view=self.view, attachments=[file]
+            )
+
+            if game.vs_bot and not status:
+                # the bot thinks after responding, as it may outlast the interaction deadline
+                if await game.play_bot_move():
+                    self.view.disable_all()
+                    embed = await game.fetch_results()
+                    self.view.stop()
+                else:
+                    embed = await game.make_embed()
+
+                file = await game.get_board_file()
+                await interaction.edit_original_response(
+                    embed=embed, view=self.view, attachments=[file]
+                )
 
 
 class ChessButton(WordInputButton):
@@ -138,11 +155,13 @@ class BetaChess(Chess):
             returns the game message
         """
         self.embed_color = embed_color
+        self._bind_bot(ctx)
 
         embed = await self.make_embed()
         self.view = ChessView(self, timeout=timeout)
 
-        self.message = await ctx.send(embed=embed, view=self.view)
+        file = await self.get_board_file()
+        self.message = await ctx.send(embed=embed, file=file, view=self.view)
         self.view.message = self.message
 
         await self.view.wait()
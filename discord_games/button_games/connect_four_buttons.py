@@ -5,7 +5,7 @@ from typing import Optional
 import discord
 from discord.ext import commands
 
-from ..connect_four import ConnectFour, BLANK
+from ..connect_four import ConnectFour
 from ..utils import BaseView, DiscordColor, DEFAULT_COLOR
 
 
@@ -34,7 +34,7 @@ class ConnectFourButton(discord.ui.Button["ConnectFourView"]):
             )
             return
 
-        if game.board[0][self.number - 1] != BLANK:
+        if not game.can_play(self.number - 1):
             await interaction.response.send_message(
                 "Selected column is full!", ephemeral=True
             )
@@ -56,6 +56,18 @@ class ConnectFourButton(discord.ui.Button["ConnectFourView"]):
             content=game.board_string(),
         )
 
+        if game.vs_bot and not status:
+            # the search runs after responding, as it may outlast the interaction deadline
+            if status := await game.play_bot_move():
+                self.view.disable_all()
+                self.view.stop()
+
+            await interaction.edit_original_response(
+                view=self.view,
+                embed=game.make_embed(status=status),
+                content=game.board_string(),
+            )
+
 
 class ConnectFourView(BaseView):
     game: ConnectFour
@@ -105,6 +117,7 @@ class BetaConnectFour(ConnectFour):
         """
         self.embed_color = embed_color
         self.button_style = button_style
+        self._bind_bot(ctx)
 
         self.view = ConnectFourView(self, timeout=timeout)
 
@@ -13,12 +13,13 @@ class CountryInput(discord.ui.Modal, title="Input your guess!"):
     def __init__(self, view: CountryView) -> None:
         super().__init__()
         self.view = view
+        lengths = self.view.game.accepted_lengths
 
         self.guess = discord.ui.TextInput(
             label="Input your guess",
             style=discord.TextStyle.short,
             required=True,
-            max_length=self.view.game.accepted_length,
+            max_length=max(lengths) if lengths else None,
         )
 
         self.add_item(self.guess)
@@ -28,7 +29,8 @@ class CountryInput(discord.ui.Modal, title="Input your guess!"):
         guess = self.guess.value.strip().lower()
         game = self.view.game
 
-        if guess == game.country:
+        match = game.match(guess)
+        if match.accepted:
             game.update_guesslog("+ GAME OVER, you won! +")
             await interaction.response.send_message(
                 f"That is correct! The country was `{game.country.title()}`"
@@ -55,7 +57,7 @@ class CountryInput(discord.ui.Modal, title="Input your guess!"):
                 self.view.stop()
                 return
             else:
-                acc = game.get_accuracy(guess)
+                acc = match.score
                 game.update_guesslog(
                     f"- [{guess}] was incorrect! but you are ({acc}%) of the way there!\n"
                     f"+ You have {game.guesses} guesses left.\n"
@@ -97,7 +99,8 @@ class CountryView(BaseView):
         hint = self.game.get_hint()
         self.game.hints -= 1
         await interaction.response.send_message(
-            f"Here is your hint: `{hint}`", ephemeral=True
+            f"Here is your hint: `{hint}`{self.game.get_region_hint()}",
+            ephemeral=True,
         )
 
         if not self.game.hints:
@@ -152,7 +155,7 @@ class BetaCountryGuesser(CountryGuesser):
         embed_color : DiscordColor, optional
             the color of the game embed, by default DEFAULT_COLOR
         ignore_diff_len : bool, optional
-            specifies whether or not to ignore guesses that are not of the same length as the correct answer, by default False
+            specifies whether or not to ignore guesses whose length matches none of the country's names, typos forgiven, by default False
         timeout : Optional[float], optional
             the timeout for the view, by default None
 
@@ -161,12 +164,13 @@ class BetaCountryGuesser(CountryGuesser):
         discord.Message
             returns the game message
         """
-        self.accepted_length: Optional[int] = (
-            len(self.country) if ignore_diff_len else None
-        )
-
         file = await self.get_country()
 
+        # sized for the longest of the country's names, give or take the typos forgiven
+        self.accepted_lengths: Optional[frozenset[int]] = (
+            self.get_accepted_lengths() if ignore_diff_len else None
+        )
+
         self.embed_color = embed_color
         self.embed = self.get_embed()
         self.embed.add_field(
@@ -43,27 +43,29 @@ class TTTButton(discord.ui.Button["TTTView"]):
             )
             return
 
-        self.label = game.player_to_emoji[user]  # type: ignore[index]
+        assert self.row is not None
+        game.place(self.row, self.col, user)
+        self.label = game.board[self.row][self.col]
         self.disabled = True
 
-        assert self.row is not None
-        assert self.label is not None
-        game.board[self.row][self.col] = self.label
-        game.turn = game.circle if user == game.cross else game.cross
-
-        tie = all(
-            button.disabled
-            for button in self.view.children
-            if isinstance(button, discord.ui.Button)
-        )
+        game_over = game.is_game_over()
+
+        if not game_over and game.vs_bot and (move := game.play_bot_move()):
+            row, col = move
+            button = chunk(self.view.children, count=3)[row][col]
+            assert isinstance(button, TTTButton)
+            button.label = game.board[row][col]
+            button.disabled = True
+
+            game_over = game.is_game_over()
 
-        if game_over := game.is_game_over(tie=tie):
+        if game_over:
             if game.winning_indexes:
                 self.view.disable_all()
                 game.create_streak()
             self.view.stop()
 
-        embed = game.make_embed(game_over=game_over or tie)
+        embed = game.make_embed(game_over=game_over)
         await interaction.response.edit_message(embed=embed, view=self.view)
 
 
@@ -135,6 +137,7 @@ class BetaTictactoe(Tictactoe):
         self.embed_color = embed_color
         self.button_style = button_style
         self.win_button_style = win_button_style
+        self._bind_bot(ctx)
 
         self.view = TTTView(self, timeout=timeout)
         self.message = await ctx.send(embed=self.make_embed(), view=self.view)
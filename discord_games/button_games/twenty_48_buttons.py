@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from typing import Optional, Literal
-import random
 
 import discord
 from discord.ext import commands
 
-from ..twenty_48 import Twenty48
+from ..twenty_48 import Twenty48, DIRECTIONS, HINT_EMOJI
 from ..utils import DiscordColor, DEFAULT_COLOR, BaseView
 
 
@@ -36,17 +35,17 @@ class Twenty48_Button(discord.ui.Button["BaseView"]):
             await interaction.message.delete()
             return
 
-        elif emoji == "➡️":
-            self.game.move_right()
-
-        elif emoji == "⬅️":
-            self.game.move_left()
-
-        elif emoji == "⬇️":
-            self.game.move_down()
+        elif emoji == HINT_EMOJI:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            hint = await self.game.get_hint(time_budget=self.game.hint_time)
+            await interaction.followup.send(
+                self.game.hint_message(hint), ephemeral=True
+            )
+            return
 
-        elif emoji == "⬆️":
-            self.game.move_up()
+        if not self.game.move(DIRECTIONS[emoji]):
+            await interaction.response.defer()
+            return
 
         lost = self.game.spawn_new()
         won = self.game.check_win()
@@ -87,6 +86,8 @@ class BetaTwenty48(Twenty48):
         win_at: Literal[2048, 4096, 8192] = 8192,
         timeout: Optional[float] = None,
         delete_button: bool = False,
+        hint_button: bool = False,
+        hint_time: Optional[float] = 0.5,
         embed_color: DiscordColor = DEFAULT_COLOR,
         **kwargs,
     ) -> discord.Message:
@@ -103,6 +104,10 @@ class BetaTwenty48(Twenty48):
             the timeout for the view, by default None
         delete_button : bool, optional
             specifies whether or not to add a stop button, by default False
+        hint_button : bool, optional
+            specifies whether or not to add a button that suggests a move, by default False
+        hint_time : Optional[float], optional
+            the number of seconds to search for a hint, by default 0.5
         embed_color : DiscordColor, optional
             the color of the game embed, by default DEFAULT_COLOR
 
@@ -113,12 +118,15 @@ class BetaTwenty48(Twenty48):
         """
         self.win_at = win_at
         self.embed_color = embed_color
+        self.hint_time = hint_time
 
         self.player = ctx.author
         self.view = BaseView(timeout=timeout)
 
-        self.board[random.randrange(4)][random.randrange(4)] = 2
-        self.board[random.randrange(4)][random.randrange(4)] = 2
+        self.spawn_initial()
+
+        if hint_button:
+            self._controls.append(HINT_EMOJI)
 
         if delete_button:
             self._controls.append("⏹️")
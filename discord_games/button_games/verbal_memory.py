@@ -5,9 +5,9 @@ import random
 
 import discord
 from discord.ext import commands
-from english_words import get_english_words_set
 
 from ..utils import BaseView, DiscordColor, DEFAULT_COLOR
+from ..lexicon import get_lexicon
 
 
 class VerbalButton(discord.ui.Button["VerbalView"]):
@@ -92,13 +92,7 @@ class VerbalMemory:
         self.lives: int = 0
         self.embed: Optional[discord.Embed] = None
 
-        english_words = list(
-            get_english_words_set(
-                ["web2"],
-                alpha=True,
-                lower=True,
-            )
-        )
+        english_words = get_lexicon("web2").sorted_words
 
         if sample_size:
             self.word_set = word_set or random.choices(
@@ -106,7 +100,7 @@ class VerbalMemory:
                 k=sample_size,
             )
         else:
-            self.word_set = word_set or english_words
+            self.word_set = word_set or list(english_words)
 
         assert self.word_set
 
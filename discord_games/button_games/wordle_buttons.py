@@ -26,7 +26,7 @@ class WordInput(discord.ui.Modal, title="Word Input"):
         content = self.word.value.lower()
         game = self.wordle_view.game
 
-        if content not in game._valid_words:
+        if not game.is_valid_guess(content):
             await interaction.response.send_message(
                 "That is not a valid word!", ephemeral=True
             )
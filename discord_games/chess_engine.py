@@ -0,0 +1,338 @@
+"""Move selection for the chess bot.
+
+Moves come from UCI engines kept in a bounded pool shared between games,
+so that many games never spawn more than ``size`` engine processes.
+Without an engine, :func:`fallback_move`, a small alpha-beta search written
+against :mod:`chess`, picks the move instead; it is CPU-bound and meant to be ran
+through :func:`discord_games.utils.run_in_process`.
+"""
+
+from __future__ import annotations
+
+from typing import Final, Optional, Union, TYPE_CHECKING
+import asyncio
+import time
+
+import chess
+import chess.engine
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+    EngineCommand: TypeAlias = Union[str, list[str]]
+
+__all__: tuple[str, ...] = (
+    "EnginePool",
+    "get_engine_pool",
+    "close_engine_pools",
+    "fallback_move",
+)
+
+DEFAULT_POOL_SIZE: Final[int] = 2
+# extra seconds granted to an engine past its think time before it is considered hung
+GRACE_PERIOD: Final[float] = 5.0
+
+_pools: dict[str, EnginePool] = {}
+
+
+class EnginePool:
+    """A bounded pool of UCI engine processes.
+
+    Engines are spawned on demand, up to ``size`` of them, and reused between moves and games;
+    a move requested while every engine is busy waits for one to be released.
+    An engine that errors or overruns its think time is killed and replaced on a later move.
+
+    Obtain pools through :func:`get_engine_pool` so that they are shared between games.
+    """
+
+    def __init__(
+        self,
+        command: EngineCommand,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        options: Optional[dict[str, Union[str, int, bool]]] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.command = command
+        self.size = size
+        self.options = options or {}
+
+        self._idle: list[chess.engine.UciProtocol] = []
+        self._semaphore = asyncio.Semaphore(size)
+        self._spawned: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<EnginePool command={self.command!r} spawned={self._spawned}/{self.size}>"
+        )
+
+    async def _spawn(self) -> chess.engine.UciProtocol:
+        _, engine = await chess.engine.popen_uci(self.command)
+        try:
+            if self.options:
+                await engine.configure(self.options)
+        except BaseException:
+            await self._discard(engine)
+            raise
+        return engine
+
+    async def _discard(self, engine: chess.engine.UciProtocol) -> None:
+        try:
+            await asyncio.wait_for(engine.quit(), GRACE_PERIOD)
+        except (chess.engine.EngineError, asyncio.TimeoutError):
+            pass
+        finally:
+            engine.transport.close()
+
+    async def play(
+        self,
+        board: chess.Board,
+        *,
+        think_time: float,
+        game: object = None,
+    ) -> Optional[chess.Move]:
+        """
+        asks an engine from the pool for its move
+
+        Parameters
+        ----------
+        board : chess.Board
+            the position to play from
+        think_time : float
+            the number of seconds the engine may think for
+        game : object, optional
+            an object identifying the game, the engine is told to start a new game when it changes, by default None
+
+        Returns
+        -------
+        Optional[chess.Move]
+            the engine's move, or None if it had none to play
+
+        Raises
+        ------
+        chess.engine.EngineError
+            the engine failed, it has been removed from the pool
+        OSError
+            the engine could not be launched
+        asyncio.TimeoutError
+            the engine overran its think time, it has been removed from the pool
+        """
+        async with self._semaphore:
+            if self._idle:
+                engine = self._idle.pop()
+            else:
+                engine = await self._spawn()
+                self._spawned += 1
+
+            try:
+                result = await asyncio.wait_for(
+                    engine.play(board, chess.engine.Limit(time=think_time), game=game),
+                    think_time + GRACE_PERIOD,
+                )
+            except BaseException:
+                self._spawned -= 1
+                await self._discard(engine)
+                raise
+
+            self._idle.append(engine)
+            return result.move
+
+    async def close(self) -> None:
+        """quits every idle engine"""
+        engines, self._idle = self._idle, []
+        self._spawned -= len(engines)
+        for engine in engines:
+            await self._discard(engine)
+
+
+def get_engine_pool(
+    command: EngineCommand, *, size: int = DEFAULT_POOL_SIZE
+) -> EnginePool:
+    """returns the shared engine pool for the given command, creating it on first use"""
+    key = command if isinstance(command, str) else " ".join(command)
+    try:
+        return _pools[key]
+    except KeyError:
+        pool = _pools[key] = EnginePool(command, size=size)
+        return pool
+
+
+async def close_engine_pools() -> None:
+    """quits every shared engine, meant to be called on shutdown"""
+    for pool in _pools.values():
+        await pool.close()
+    _pools.clear()
+
+
+# centipawn values, indexed by piece type
+PIECE_VALUES: Final[tuple[int, ...]] = (0, 100, 320, 330, 500, 900, 0)
+MATE_SCORE: Final[int] = 100_000
+INFINITY: Final[int] = MATE_SCORE * 2
+
+
+def _centrality(square: int) -> int:
+    # 0 on the edge of the board up to 3 on the four central squares
+    file_distance = abs(7 - 2 * chess.square_file(square)) // 2
+    rank_distance = abs(7 - 2 * chess.square_rank(square)) // 2
+    return 3 - max(file_distance, rank_distance)
+
+
+# a bonus for each of the 64 squares, from white's side with a1 first
+_CENTER: Final[tuple[int, ...]] = tuple(3 * _centrality(sq) for sq in chess.SQUARES)
+_PAWN_ADVANCE: Final[tuple[int, ...]] = tuple(
+    4 * max(chess.square_rank(sq) - 1, 0) for sq in chess.SQUARES
+)
+
+
+def _piece_bonus(piece_type: int, square: int) -> int:
+    if piece_type == chess.PAWN:
+        return _PAWN_ADVANCE[square] + _CENTER[square]
+    if piece_type in (chess.KNIGHT, chess.BISHOP):
+        return 2 * _CENTER[square]
+    if piece_type == chess.QUEEN:
+        return _CENTER[square]
+    return 0
+
+
+def _evaluate(board: chess.Board) -> int:
+    # from the side to move's point of view
+    score = 0
+    for square, piece in board.piece_map().items():
+        value = PIECE_VALUES[piece.piece_type]
+        if piece.color == chess.WHITE:
+            score += value + _piece_bonus(piece.piece_type, square)
+        else:
+            score -= value + _piece_bonus(piece.piece_type, chess.square_mirror(square))
+    return score if board.turn == chess.WHITE else -score
+
+
+class _Timeout(Exception):
+    pass
+
+
+class _Search:
+    __slots__ = ("deadline", "nodes")
+
+    def __init__(self, deadline: Optional[float]) -> None:
+        self.deadline = deadline
+        self.nodes: int = 0
+
+    def _tick(self) -> None:
+        self.nodes += 1
+        if (
+            self.deadline is not None
+            and not self.nodes & 0xFF
+            and time.perf_counter() > self.deadline
+        ):
+            raise _Timeout
+
+    def _ordered(self, board: chess.Board, moves) -> list[chess.Move]:
+        # most valuable victim first, then least valuable attacker
+        def key(move: chess.Move) -> int:
+            score = 0
+            if board.is_capture(move):
+                victim = board.piece_type_at(move.to_square) or chess.PAWN
+                attacker = board.piece_type_at(move.from_square) or chess.PAWN
+                score += 10 * PIECE_VALUES[victim] - PIECE_VALUES[attacker]
+            if move.promotion:
+                score += PIECE_VALUES[move.promotion]
+            return -score
+
+        return sorted(moves, key=key)
+
+    def quiesce(self, board: chess.Board, alpha: int, beta: int) -> int:
+        self._tick()
+        stand_pat = _evaluate(board)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        for move in self._ordered(board, board.generate_legal_captures()):
+            board.push(move)
+            score = -self.quiesce(board, -beta, -alpha)
+            board.pop()
+
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def negamax(self, board: chess.Board, depth: int, alpha: int, beta: int) -> int:
+        self._tick()
+        if board.is_checkmate():
+            return -MATE_SCORE + board.ply()
+        if board.is_stalemate() or board.is_insufficient_material():
+            return 0
+        if depth <= 0:
+            return self.quiesce(board, alpha, beta)
+
+        best = -INFINITY
+        for move in self._ordered(board, board.legal_moves):
+            board.push(move)
+            score = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.pop()
+
+            if score > best:
+                best = score
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+        return best
+
+
+def fallback_move(fen: str, *, think_time: float, max_depth: int = 4) -> Optional[str]:
+    """
+    searches for a move without an engine, using alpha-beta negamax with iterative deepening
+
+    Parameters
+    ----------
+    fen : str
+        the position to play from
+    think_time : float
+        the number of seconds to search for, a search of depth 1 always completes
+    max_depth : int, optional
+        the maximum number of plies to look ahead, by default 4
+
+    Returns
+    -------
+    Optional[str]
+        the best move in UCI notation, or None if there are no legal moves
+    """
+    board = chess.Board(fen)
+    moves = list(board.legal_moves)
+    if not moves:
+        return None
+
+    deadline = time.perf_counter() + think_time
+    searcher = _Search(None)
+    best_move = moves[0]
+
+    for depth in range(1, max_depth + 1):
+        searcher.deadline = deadline if depth > 1 else None
+        # the previous iteration's best move is searched first
+        ordered = [
+            best_move,
+            *(m for m in searcher._ordered(board, moves) if m != best_move),
+        ]
+        alpha, candidate = -INFINITY, best_move
+        try:
+            for move in ordered:
+                board.push(move)
+                try:
+                    score = -searcher.negamax(board, depth - 1, -INFINITY, -alpha)
+                finally:
+                    board.pop()
+
+                if score > alpha:
+                    alpha, candidate = score, move
+        except _Timeout:
+            break
+
+        best_move = candidate
+        if alpha >= MATE_SCORE - board.ply() - depth:
+            break
+
+    return best_move.uci()
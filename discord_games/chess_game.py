@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-from typing import Optional, ClassVar, Literal
+from typing import Final, Optional, Literal, Union
+from io import BytesIO
 import asyncio
 
 import discord
 from discord.ext import commands
 import chess
+import chess.engine
 
-from .utils import DiscordColor, DEFAULT_COLOR, Player
+from .utils import DiscordColor, DEFAULT_COLOR, Player, executor, run_in_process
+from .dispatcher import GameDispatcher
+from .chess_renderer import render_board
+from .chess_engine import EnginePool, fallback_move, get_engine_pool
+
+BOARD_FILENAME: Final[str] = "chess.png"
+
+
+@executor()
+def _render_board(
+    board_fen: str, last_move: Optional[str], check: Optional[str]
+) -> bytes:
+    return render_board(board_fen, last_move=last_move, check=check)
 
 
 class Chess:
@@ -15,20 +29,33 @@ class Chess:
 
     Two-player chess rendered as a board image.
     Moves are submitted in standard algebraic notation.
+    Leaving out ``black`` makes the bot play black, through ``engine`` if given
+    or a built-in search otherwise.
     """
 
-    BASE_URL: ClassVar[str] = "http://www.fen-to-image.com/image/64/double/coords/"
-
     def __init__(
         self,
         *,
         white: Player,
-        black: Player,
+        black: Optional[Player] = None,
+        engine: Optional[Union[str, EnginePool]] = None,
+        think_time: float = 1.0,
     ) -> None:
+        if think_time <= 0:
+            raise ValueError("think_time must be positive")
+
         self.white = white
         self.black = black
         self.turn = self.white
 
+        self.vs_bot: bool = black is None
+        self.think_time = think_time
+        self.engine: Optional[EnginePool] = (
+            get_engine_pool(engine) if isinstance(engine, str) else engine
+        )
+        # identifies this game to pooled engines, so they reset between games
+        self._engine_game = object()
+
         self.winner: Optional[Player] = None
         self.message: Optional[discord.Message] = None
 
@@ -36,13 +63,54 @@ class Chess:
 
         self.last_move: dict[str, str] = {}
 
+    def _bind_bot(self, ctx: commands.Context[commands.Bot]) -> None:
+        if self.vs_bot and self.black is None:
+            self.black = ctx.me  # type: ignore[assignment]
+
+    async def get_bot_move(self) -> Optional[chess.Move]:
+        """
+        asks the engine pool for the bot's move within the game's think time,
+        falling back to the built-in search in a worker process if there is no engine or it failed
+
+        Returns
+        -------
+        Optional[chess.Move]
+            the move to play, or None if there are no legal moves
+        """
+        if self.engine is not None:
+            try:
+                return await self.engine.play(
+                    self.board, think_time=self.think_time, game=self._engine_game
+                )
+            except (chess.engine.EngineError, OSError, asyncio.TimeoutError):
+                pass
+
+        uci = await run_in_process(
+            fallback_move, self.board.fen(), think_time=self.think_time
+        )
+        return None if uci is None else chess.Move.from_uci(uci)
+
+    async def play_bot_move(self) -> bool:
+        """
+        plays the bot's move
+
+        Returns
+        -------
+        bool
+            whether or not the game is over
+        """
+        move = await self.get_bot_move()
+        if move is not None:
+            await self.place_move(move.uci())
+        return self.board.is_game_over()
+
     def get_color(self) -> Literal["white", "black"]:
         return "white" if self.turn == self.white else "black"
 
     async def make_embed(self) -> discord.Embed:
         embed = discord.Embed(title="Chess Game", color=self.embed_color)
         embed.description = f"**Turn:** `{self.turn}`\n**Color:** `{self.get_color()}`\n**Check:** `{self.board.is_check()}`"
-        embed.set_image(url=f"{self.BASE_URL}{self.board.board_fen()}")
+        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
 
         embed.add_field(
             name="Last Move",
@@ -76,9 +144,21 @@ class Chess:
                 f"Game over\nVariant end condition. | Score: `{results}`"
             )
 
-        embed.set_image(url=f"{self.BASE_URL}{self.board.board_fen()}")
+        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
         return embed
 
+    async def get_board_file(self) -> discord.File:
+        """renders the current position, highlighting the last move and any check"""
+        board = self.board
+        last_move = board.peek().uci() if board.move_stack else None
+        check = None
+        if board.is_check():
+            king = board.king(board.turn)
+            check = chess.square_name(king) if king is not None else None
+
+        png = await _render_board(board.board_fen(), last_move, check)
+        return discord.File(BytesIO(png), filename=BOARD_FILENAME)
+
     async def start(
         self,
         ctx: commands.Context[commands.Bot],
@@ -108,9 +188,11 @@ class Chess:
             returns the game message
         """
         self.embed_color = embed_color
+        self._bind_bot(ctx)
 
         embed = await self.make_embed()
-        self.message = await ctx.send(embed=embed, **kwargs)
+        file = await self.get_board_file()
+        self.message = await ctx.send(embed=embed, file=file, **kwargs)
 
         while not ctx.bot.is_closed():
 
@@ -124,14 +206,18 @@ class Chess:
                     return False
 
             try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", timeout=timeout, check=check
+                message: discord.Message = await GameDispatcher.get(
+                    ctx.bot
+                ).wait_for_message(
+                    channel=ctx.channel.id,
+                    author=self.turn.id,
+                    check=check,
+                    timeout=timeout,
                 )
             except asyncio.TimeoutError:
                 return
 
             await self.place_move(message.content.lower())
-            embed = await self.make_embed()
 
             if add_reaction_after_move:
                 await message.add_reaction("✅")
@@ -139,10 +225,17 @@ class Chess:
             if self.board.is_game_over():
                 break
 
-            await self.message.edit(embed=embed)
+            if self.vs_bot and await self.play_bot_move():
+                break
+
+            embed = await self.make_embed()
+
+            file = await self.get_board_file()
+            await self.message.edit(embed=embed, attachments=[file])
 
         embed = await self.fetch_results()
-        await self.message.edit(embed=embed)
+        file = await self.get_board_file()
+        await self.message.edit(embed=embed, attachments=[file])
         await ctx.send("~ Game Over ~")
 
         return self.message
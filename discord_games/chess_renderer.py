@@ -0,0 +1,278 @@
+"""A Pillow renderer for chess positions.
+
+Piece sprites are drawn once per piece at 4x scale and downsampled,
+the board background (squares and coordinates) is drawn once per orientation
+and whole positions are cached as encoded PNGs, keyed by FEN, last move and check.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Final, Optional, TYPE_CHECKING
+import functools
+import pathlib
+
+from PIL import Image, ImageDraw, ImageFont
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+    Color: TypeAlias = tuple[int, int, int]
+    Shape: TypeAlias = list[tuple[str, tuple]]
+
+__all__: tuple[str, ...] = (
+    "SQUARE",
+    "render_board",
+)
+
+SQUARE: Final[int] = 64
+SCALE: Final[int] = 4
+BOARD_LENGTH: Final[int] = SQUARE * 8
+
+LIGHT: Final[Color] = (240, 217, 181)
+DARK: Final[Color] = (181, 136, 99)
+LAST_MOVE: Final[tuple[int, int, int, int]] = (205, 210, 60, 130)
+CHECK: Final[tuple[int, int, int, int]] = (230, 30, 30, 170)
+
+WHITE_PIECE: Final[tuple[Color, Color]] = ((250, 250, 250), (30, 30, 30))
+BLACK_PIECE: Final[tuple[Color, Color]] = ((35, 35, 35), (225, 225, 225))
+
+FONT_PATH: Final[pathlib.Path] = (
+    pathlib.Path(__file__).parent / "assets/ClearSans-Bold.ttf"
+)
+
+# the outlines of every piece on a 256x256 canvas, drawn in order
+_BASE: Final[tuple[str, tuple]] = ("rounded_rectangle", (56, 196, 200, 228))
+_SHAPES: Final[dict[str, Shape]] = {
+    "p": [
+        ("polygon", ((92, 200), (110, 120), (146, 120), (164, 200))),
+        ("ellipse", (86, 110, 170, 134)),
+        ("ellipse", (94, 50, 162, 118)),
+        _BASE,
+    ],
+    "r": [
+        ("rectangle", (84, 92, 172, 200)),
+        (
+            "polygon",
+            (
+                (64, 40),
+                (92, 40),
+                (92, 62),
+                (114, 62),
+                (114, 40),
+                (142, 40),
+                (142, 62),
+                (164, 62),
+                (164, 40),
+                (192, 40),
+                (192, 96),
+                (64, 96),
+            ),
+        ),
+        _BASE,
+    ],
+    "n": [
+        (
+            "polygon",
+            (
+                (80, 200),
+                (96, 150),
+                (118, 122),
+                (72, 132),
+                (56, 110),
+                (98, 62),
+                (112, 30),
+                (130, 54),
+                (162, 62),
+                (192, 112),
+                (194, 200),
+            ),
+        ),
+        ("ellipse", (106, 74, 120, 88)),
+        _BASE,
+    ],
+    "b": [
+        ("polygon", ((84, 200), (106, 172), (150, 172), (172, 200))),
+        ("ellipse", (88, 52, 168, 170)),
+        ("ellipse", (114, 22, 142, 50)),
+        ("line", ((118, 88), (146, 116))),
+        _BASE,
+    ],
+    "q": [
+        (
+            "polygon",
+            (
+                (64, 196),
+                (44, 72),
+                (76, 136),
+                (88, 56),
+                (108, 132),
+                (128, 44),
+                (148, 132),
+                (168, 56),
+                (180, 136),
+                (212, 72),
+                (192, 196),
+            ),
+        ),
+        ("ellipse", (32, 60, 56, 84)),
+        ("ellipse", (76, 44, 100, 68)),
+        ("ellipse", (116, 30, 140, 54)),
+        ("ellipse", (156, 44, 180, 68)),
+        ("ellipse", (200, 60, 224, 84)),
+        _BASE,
+    ],
+    "k": [
+        ("rectangle", (118, 18, 138, 92)),
+        ("rectangle", (98, 34, 158, 54)),
+        (
+            "polygon",
+            (
+                (64, 196),
+                (50, 104),
+                (96, 124),
+                (128, 86),
+                (160, 124),
+                (206, 104),
+                (192, 196),
+            ),
+        ),
+        _BASE,
+    ],
+}
+
+
+@functools.lru_cache(maxsize=2)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(FONT_PATH), size)
+
+
+@functools.lru_cache(maxsize=12)
+def _piece_sprite(symbol: str) -> Image.Image:
+    fill, outline = WHITE_PIECE if symbol.isupper() else BLACK_PIECE
+    width = 2 * SCALE
+
+    img = Image.new("RGBA", (SQUARE * SCALE, SQUARE * SCALE), (0, 0, 0, 0))
+    cursor = ImageDraw.Draw(img)
+
+    for kind, xy in _SHAPES[symbol.lower()]:
+        if kind == "line":
+            cursor.line(xy, fill=outline, width=width)
+        elif kind == "rounded_rectangle":
+            cursor.rounded_rectangle(
+                xy, radius=12, fill=fill, outline=outline, width=width
+            )
+        else:
+            getattr(cursor, kind)(xy, fill=fill, outline=outline, width=width)
+
+    return img.resize((SQUARE, SQUARE), Image.LANCZOS)
+
+
+@functools.lru_cache(maxsize=2)
+def _background(flipped: bool) -> Image.Image:
+    img = Image.new("RGBA", (BOARD_LENGTH, BOARD_LENGTH), LIGHT)
+    cursor = ImageDraw.Draw(img)
+    font = _load_font(13)
+
+    for row in range(8):
+        for col in range(8):
+            x, y = col * SQUARE, row * SQUARE
+            dark = (row + col) % 2 == 1
+            if dark:
+                cursor.rectangle((x, y, x + SQUARE - 1, y + SQUARE - 1), fill=DARK)
+
+            text_color = LIGHT if dark else DARK
+            if col == 0:
+                rank = row + 1 if flipped else 8 - row
+                cursor.text((x + 3, y + 2), str(rank), font=font, fill=text_color)
+            if row == 7:
+                file = "hgfedcba"[col] if flipped else "abcdefgh"[col]
+                cursor.text(
+                    (x + SQUARE - 3, y + SQUARE - 2),
+                    file,
+                    font=font,
+                    fill=text_color,
+                    anchor="rd",
+                )
+    return img
+
+
+@functools.lru_cache(maxsize=2)
+def _overlay(color: tuple[int, int, int, int], radial: bool) -> Image.Image:
+    img = Image.new("RGBA", (SQUARE, SQUARE), (0, 0, 0, 0))
+    cursor = ImageDraw.Draw(img)
+    if radial:
+        # concentric rings fading out towards the edge of the square
+        r, g, b, a = color
+        for i in range(SQUARE // 2, 0, -2):
+            alpha = int(a * (1 - i / (SQUARE / 2)) ** 0.5)
+            half = SQUARE // 2
+            cursor.ellipse(
+                (half - i, half - i, half + i, half + i), fill=(r, g, b, alpha)
+            )
+    else:
+        cursor.rectangle((0, 0, SQUARE, SQUARE), fill=color)
+    return img
+
+
+def _square_origin(square: str, flipped: bool) -> tuple[int, int]:
+    col = ord(square[0]) - ord("a")
+    row = 8 - int(square[1])
+    if flipped:
+        col, row = 7 - col, 7 - row
+    return col * SQUARE, row * SQUARE
+
+
+@functools.lru_cache(maxsize=256)
+def render_board(
+    board_fen: str,
+    *,
+    last_move: Optional[str] = None,
+    check: Optional[str] = None,
+    flipped: bool = False,
+) -> bytes:
+    """
+    renders the given position into an encoded PNG
+
+    Parameters
+    ----------
+    board_fen : str
+        the piece placement part of the FEN
+    last_move : Optional[str], optional
+        the last move in UCI notation, whose squares are highlighted, by default None
+    check : Optional[str], optional
+        the square of the king in check, by default None
+    flipped : bool, optional
+        specifies whether or not to render the board from black's side, by default False
+
+    Returns
+    -------
+    bytes
+        the PNG image
+    """
+    img = _background(flipped).copy()
+
+    if last_move:
+        highlight = _overlay(LAST_MOVE, False)
+        for square in (last_move[:2], last_move[2:4]):
+            img.alpha_composite(highlight, _square_origin(square, flipped))
+
+    if check:
+        img.alpha_composite(_overlay(CHECK, True), _square_origin(check, flipped))
+
+    for row, rank in enumerate(board_fen.split("/")):
+        col = 0
+        for char in rank:
+            if char.isdigit():
+                col += int(char)
+                continue
+
+            x, y = col * SQUARE, row * SQUARE
+            if flipped:
+                x, y = BOARD_LENGTH - SQUARE - x, BOARD_LENGTH - SQUARE - y
+            img.alpha_composite(_piece_sprite(char), (x, y))
+            col += 1
+
+    buffer = BytesIO()
+    img.convert("RGB").save(buffer, "PNG")
+    return buffer.getvalue()
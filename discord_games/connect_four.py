@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Optional, Union, TYPE_CHECKING
 import asyncio
 
 import discord
 from discord.ext import commands
 
-from .utils import DiscordColor, DEFAULT_COLOR, Player, double_wait
+from .utils import DiscordColor, DEFAULT_COLOR, Player, run_in_process
+from .dispatcher import GameDispatcher
+from .connect_four_engine import HEIGHT, WIDTH, Bitboard
+from . import connect_four_solver as solver
+
+if TYPE_CHECKING:
+    from .connect_four_solver import Difficulty
 
 RED = "🔴"
 BLUE = "🔵"
@@ -18,18 +24,27 @@ class ConnectFour:
 
     Two players drop pieces into columns, trying to
     connect four in a row in any direction.
+    Leaving out ``blue`` makes the bot play blue.
     """
 
     def __init__(
         self,
         *,
         red: Player,
-        blue: Player,
+        blue: Optional[Player] = None,
+        difficulty: Difficulty = "medium",
     ) -> None:
+        if difficulty not in solver.DIFFICULTIES:
+            raise ValueError(
+                f"difficulty must be one of {', '.join(solver.DIFFICULTIES)}, not {difficulty!r}"
+            )
+
         self.red_player = red
         self.blue_player = blue
+        self.vs_bot: bool = blue is None
+        self.difficulty: Difficulty = difficulty
 
-        self.board: list[list[str]] = [[BLANK for _ in range(7)] for _ in range(6)]
+        self.bitboard = Bitboard()
         self._controls: tuple[str, ...] = (
             "1️⃣",
             "2️⃣",
@@ -47,14 +62,69 @@ class ConnectFour:
         self._conversion: dict[str, int] = {
             emoji: i for i, emoji in enumerate(self._controls)
         }
-        self.player_to_emoji: dict[Player, str] = {
+        # the bitboard's players, red always moving first
+        self._pieces: tuple[str, str] = (RED, BLUE)
+        self._assign_pieces()
+
+    def _assign_pieces(self) -> None:
+        self.player_to_emoji: dict[Optional[Player], str] = {
             self.red_player: RED,
             self.blue_player: BLUE,
         }
-        self.emoji_to_player: dict[str, Player] = {
+        self.emoji_to_player: dict[str, Optional[Player]] = {
             v: k for k, v in self.player_to_emoji.items()
         }
 
+    def _bind_bot(self, ctx: commands.Context[commands.Bot]) -> None:
+        if self.vs_bot and self.blue_player is None:
+            self.blue_player = ctx.me  # type: ignore[assignment]
+            self._assign_pieces()
+
+    async def get_bot_move(self) -> Optional[int]:
+        """
+        searches for the bot's move at the game's difficulty in a worker process
+
+        Returns
+        -------
+        Optional[int]
+            the column to play, or None if the board is full
+        """
+        return await run_in_process(solver.best_move, self.bitboard, self.difficulty)
+
+    async def play_bot_move(self) -> bool:
+        """
+        plays the bot's move
+
+        Returns
+        -------
+        bool
+            whether or not the game is over
+        """
+        column = await self.get_bot_move()
+        if column is not None:
+            self.place_move(column, self.blue_player)
+        return self.is_game_over()
+
+    @property
+    def board(self) -> list[list[str]]:
+        """the emoji grid of the bitboard, top row first"""
+        pieces = self._pieces
+        board = []
+        for row in range(HEIGHT - 1, -1, -1):
+            board.append(
+                [
+                    BLANK
+                    if (piece := self.bitboard.cell(row, col)) is None
+                    else pieces[piece]
+                    for col in range(WIDTH)
+                ]
+            )
+        return board
+
+    def can_play(self, column: int) -> bool:
+        """returns whether or not the given column has room for another piece"""
+        return self.bitboard.can_play(column)
+
     def board_string(self) -> str:
         board = "1️⃣2️⃣3️⃣4️⃣5️⃣6️⃣7️⃣\n"
         for row in self.board:
@@ -77,67 +147,22 @@ class ConnectFour:
 
             column = self._conversion[column]
 
-        for x in range(5, -1, -1):
-            if self.board[x][column] == BLANK:
-                self.board[x][column] = self.player_to_emoji[user]
-                break
+        self.bitboard.play(column)
 
         self.turn = self.red_player if user == self.blue_player else self.blue_player
         return self.board
 
     def is_game_over(self) -> bool:
-        if all(i != BLANK for i in self.board[0]):
+        if not self.bitboard.moves:
+            return False
+
+        # only the player who just moved can have completed a line
+        last = self.bitboard.turn ^ 1
+        if self.bitboard.won(last):
+            self.winner = self.emoji_to_player[self._pieces[last]]
             return True
 
-        for x in range(6):
-            for i in range(4):
-                if (
-                    self.board[x][i]
-                    == self.board[x][i + 1]
-                    == self.board[x][i + 2]
-                    == self.board[x][i + 3]
-                    and self.board[x][i] != BLANK
-                ):
-                    self.winner = self.emoji_to_player[self.board[x][i]]
-                    return True
-
-        for x in range(3):
-            for i in range(7):
-                if (
-                    self.board[x][i]
-                    == self.board[x + 1][i]
-                    == self.board[x + 2][i]
-                    == self.board[x + 3][i]
-                    and self.board[x][i] != BLANK
-                ):
-                    self.winner = self.emoji_to_player[self.board[x][i]]
-                    return True
-
-        for x in range(3):
-            for i in range(4):
-                if (
-                    self.board[x][i]
-                    == self.board[x + 1][i + 1]
-                    == self.board[x + 2][i + 2]
-                    == self.board[x + 3][i + 3]
-                    and self.board[x][i] != BLANK
-                ):
-                    self.winner = self.emoji_to_player[self.board[x][i]]
-                    return True
-
-        for x in range(5, 2, -1):
-            for i in range(4):
-                if (
-                    self.board[x][i]
-                    == self.board[x - 1][i + 1]
-                    == self.board[x - 2][i + 2]
-                    == self.board[x - 3][i + 3]
-                    and self.board[x][i] != BLANK
-                ):
-                    self.winner = self.emoji_to_player[self.board[x][i]]
-                    return True
-
-        return False
+        return self.bitboard.is_full()
 
     async def start(
         self,
@@ -168,6 +193,7 @@ class ConnectFour:
             returns the game message
         """
         self.embed_color = embed_color
+        self._bind_bot(ctx)
 
         embed = self.make_embed(status=False)
         self.message = await ctx.send(self.board_string(), embed=embed, **kwargs)
@@ -184,15 +210,17 @@ class ConnectFour:
                     and user == self.turn
                     and self.message is not None
                     and reaction.message.id == self.message.id
-                    and self.board[0][self._conversion[str(reaction.emoji)]] == BLANK
+                    and self.can_play(self._conversion[str(reaction.emoji)])
                 )
 
             try:
-                done, _ = await double_wait(
-                    ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-                    ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+                reaction, user = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+                    message=self.message.id,
+                    user=self.turn.id,
+                    check=check,
+                    timeout=timeout,
+                    remove=True,
                 )
-                reaction, user = done.pop().result()
             except asyncio.TimeoutError:
                 break
 
@@ -202,6 +230,9 @@ class ConnectFour:
             if status := self.is_game_over():
                 break
 
+            if self.vs_bot and (status := await self.play_bot_move()):
+                break
+
             if remove_reaction_after:
                 await self.message.remove_reaction(emoji, user)
 
@@ -0,0 +1,156 @@
+"""A bitboard engine for Connect Four.
+
+Each player's pieces are kept in a 49-bit integer: column ``c`` occupies bits
+``7 * c`` to ``7 * c + 6``, its bottom cell being the lowest bit.
+The 7th bit of every column is a sentinel that stays empty,
+so shifting a mask never carries a line over from one column into the next.
+
+A line of four is found with one shift-and-mask pair per direction:
+``m = b & (b >> s)`` marks every piece continuing a pair in direction ``s``
+and ``m & (m >> 2 * s)`` is then non-zero exactly when four are aligned.
+"""
+
+from __future__ import annotations
+
+from typing import Final, Iterator, Optional
+
+__all__: tuple[str, ...] = (
+    "WIDTH",
+    "HEIGHT",
+    "Bitboard",
+    "has_four",
+)
+
+WIDTH: Final[int] = 7
+HEIGHT: Final[int] = 6
+# bits per column, including the sentinel
+COLUMN_BITS: Final[int] = HEIGHT + 1
+
+# vertical, horizontal, and both diagonals
+DIRECTIONS: Final[tuple[int, ...]] = (1, COLUMN_BITS, COLUMN_BITS - 1, COLUMN_BITS + 1)
+
+BOTTOM_MASK: Final[int] = sum(1 << (c * COLUMN_BITS) for c in range(WIDTH))
+BOARD_MASK: Final[int] = BOTTOM_MASK * ((1 << HEIGHT) - 1)
+
+
+def bottom_mask(column: int) -> int:
+    return 1 << (column * COLUMN_BITS)
+
+
+def top_mask(column: int) -> int:
+    return 1 << (column * COLUMN_BITS + HEIGHT - 1)
+
+
+def column_mask(column: int) -> int:
+    return ((1 << HEIGHT) - 1) << (column * COLUMN_BITS)
+
+
+def has_four(pieces: int) -> bool:
+    """returns whether or not the given pieces contain four in a row"""
+    for shift in DIRECTIONS:
+        pairs = pieces & (pieces >> shift)
+        if pairs & (pairs >> 2 * shift):
+            return True
+    return False
+
+
+class Bitboard:
+    """A Connect Four position.
+
+    Holds one bitmask per player and the height of every column.
+    Players are ``0`` (who moves first) and ``1``, and they alternate turns.
+    """
+
+    __slots__ = ("pieces", "heights", "moves")
+
+    def __init__(self) -> None:
+        self.pieces: list[int] = [0, 0]
+        self.heights: list[int] = [0] * WIDTH
+        self.moves: int = 0
+
+    def __repr__(self) -> str:
+        return f"<Bitboard moves={self.moves}>"
+
+    def copy(self) -> Bitboard:
+        board = Bitboard.__new__(Bitboard)
+        board.pieces = self.pieces.copy()
+        board.heights = self.heights.copy()
+        board.moves = self.moves
+        return board
+
+    @property
+    def turn(self) -> int:
+        """the player to move"""
+        return self.moves & 1
+
+    @property
+    def mask(self) -> int:
+        """every occupied cell"""
+        return self.pieces[0] | self.pieces[1]
+
+    def key(self) -> int:
+        """returns an integer uniquely identifying this position"""
+        # the pieces of the player to move plus the mask shifted onto the bottom row;
+        # a column's height becomes the single bit above its highest piece
+        return self.pieces[self.turn] + self.mask + BOTTOM_MASK
+
+    def can_play(self, column: int) -> bool:
+        return self.heights[column] < HEIGHT
+
+    def legal_moves(self) -> Iterator[int]:
+        return (c for c in range(WIDTH) if self.heights[c] < HEIGHT)
+
+    def is_full(self) -> bool:
+        return self.moves >= WIDTH * HEIGHT
+
+    def play(self, column: int) -> int:
+        """
+        drops a piece for the player to move into the given column
+
+        Parameters
+        ----------
+        column : int
+            the column to play in, from 0 to 6
+
+        Returns
+        -------
+        int
+            the row the piece landed in, 0 being the bottom
+
+        Raises
+        ------
+        ValueError
+            the column is full
+        """
+        row = self.heights[column]
+        if row >= HEIGHT:
+            raise ValueError(f"Column {column} is full")
+
+        self.pieces[self.moves & 1] |= 1 << (column * COLUMN_BITS + row)
+        self.heights[column] = row + 1
+        self.moves += 1
+        return row
+
+    def undo(self, column: int) -> None:
+        """takes back the last piece played in the given column"""
+        self.moves -= 1
+        row = self.heights[column] = self.heights[column] - 1
+        self.pieces[self.moves & 1] &= ~(1 << (column * COLUMN_BITS + row))
+
+    def won(self, player: int) -> bool:
+        """returns whether or not the given player has four in a row"""
+        return has_four(self.pieces[player])
+
+    def is_winning_move(self, column: int) -> bool:
+        """returns whether or not playing the given column wins for the player to move"""
+        move = 1 << (column * COLUMN_BITS + self.heights[column])
+        return has_four(self.pieces[self.moves & 1] | move)
+
+    def cell(self, row: int, column: int) -> Optional[int]:
+        """returns the player occupying the given cell (row 0 being the bottom), or None"""
+        bit = 1 << (column * COLUMN_BITS + row)
+        if self.pieces[0] & bit:
+            return 0
+        if self.pieces[1] & bit:
+            return 1
+        return None
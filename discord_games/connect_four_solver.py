@@ -0,0 +1,264 @@
+"""A negamax solver for Connect Four, built on :mod:`connect_four_engine`.
+
+The functions here are CPU-bound and meant to be ran through
+:func:`discord_games.utils.run_in_process` rather than on the event loop.
+"""
+
+from __future__ import annotations
+
+from typing import Final, NamedTuple, Optional, TYPE_CHECKING
+import time
+
+from .connect_four_engine import COLUMN_BITS, HEIGHT, WIDTH, Bitboard, column_mask
+
+if TYPE_CHECKING:
+    from typing import Literal
+    from typing_extensions import TypeAlias
+
+    Difficulty: TypeAlias = Literal["easy", "medium", "hard", "expert"]
+
+__all__: tuple[str, ...] = (
+    "DIFFICULTIES",
+    "SearchResult",
+    "search",
+    "best_move",
+)
+
+# difficulty -> (maximum depth, time budget in seconds)
+DIFFICULTIES: Final[dict[str, tuple[int, float]]] = {
+    "easy": (2, 0.1),
+    "medium": (4, 0.5),
+    "hard": (8, 1.0),
+    "expert": (WIDTH * HEIGHT, 2.5),
+}
+
+# scores above this are forced wins, the sooner the win the higher the score
+WIN_SCORE: Final[int] = 1_000_000
+INFINITY: Final[int] = WIN_SCORE * 2
+
+# columns closer to the center take part in more lines, so they are searched first
+ORDER: Final[tuple[int, ...]] = (3, 2, 4, 1, 5, 0, 6)
+
+EXACT: Final[int] = 0
+LOWER: Final[int] = 1
+UPPER: Final[int] = 2
+
+# the weight of a line holding 1, 2 or 3 pieces of a single player
+LINE_WEIGHTS: Final[tuple[int, ...]] = (0, 1, 5, 50)
+CENTER_WEIGHT: Final[int] = 3
+CENTER_MASK: Final[int] = column_mask(WIDTH // 2)
+
+
+def _build_lines() -> tuple[int, ...]:
+    lines = []
+    for col in range(WIDTH):
+        for row in range(HEIGHT):
+            for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                end_col, end_row = col + 3 * dc, row + 3 * dr
+                if 0 <= end_col < WIDTH and 0 <= end_row < HEIGHT:
+                    lines.append(
+                        sum(
+                            1 << ((col + i * dc) * COLUMN_BITS + row + i * dr)
+                            for i in range(4)
+                        )
+                    )
+    return tuple(lines)
+
+
+# every group of 4 cells that forms a line, 69 in total
+LINES: Final[tuple[int, ...]] = _build_lines()
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def _evaluate(board: Bitboard) -> int:
+    mine = board.pieces[board.turn]
+    theirs = board.pieces[board.turn ^ 1]
+
+    score = CENTER_WEIGHT * (
+        _popcount(mine & CENTER_MASK) - _popcount(theirs & CENTER_MASK)
+    )
+    for line in LINES:
+        a = mine & line
+        b = theirs & line
+        if a and not b:
+            score += LINE_WEIGHTS[_popcount(a)]
+        elif b and not a:
+            score -= LINE_WEIGHTS[_popcount(b)]
+    return score
+
+
+class _Timeout(Exception):
+    pass
+
+
+class SearchResult(NamedTuple):
+    move: Optional[int]
+    score: int
+    depth: int
+    nodes: int
+
+
+class _Search:
+    __slots__ = ("deadline", "table", "nodes")
+
+    def __init__(self, deadline: Optional[float]) -> None:
+        self.deadline = deadline
+        # position key -> (depth searched, bound type, value, best column)
+        self.table: dict[int, tuple[int, int, int, Optional[int]]] = {}
+        self.nodes: int = 0
+
+    def negamax(self, board: Bitboard, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if (
+            self.deadline is not None
+            and not self.nodes & 0x3FF
+            and time.perf_counter() > self.deadline
+        ):
+            raise _Timeout
+
+        moves = board.moves
+        if moves >= WIDTH * HEIGHT:
+            return 0
+
+        for col in ORDER:
+            if board.can_play(col) and board.is_winning_move(col):
+                return WIN_SCORE - moves
+
+        if depth <= 0:
+            return _evaluate(board)
+
+        key = board.key()
+        best_col: Optional[int] = None
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, flag, value, best_col = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        original_alpha = alpha
+        best = -INFINITY
+
+        for col in _ordered(best_col):
+            if not board.can_play(col):
+                continue
+
+            board.play(col)
+            score = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.undo(col)
+
+            if score > best:
+                best, best_col = score, col
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (depth, flag, best, best_col)
+        return best
+
+
+def _ordered(first: Optional[int]) -> tuple[int, ...]:
+    if first is None:
+        return ORDER
+    return (first, *(col for col in ORDER if col != first))
+
+
+def search(
+    board: Bitboard,
+    *,
+    max_depth: int = 8,
+    time_budget: Optional[float] = 1.0,
+) -> SearchResult:
+    """
+    searches for the best column using alpha-beta negamax with iterative deepening
+
+    Parameters
+    ----------
+    board : Bitboard
+        the position to search, it is left untouched
+    max_depth : int, optional
+        the maximum number of plies to look ahead, by default 8
+    time_budget : Optional[float], optional
+        the number of seconds to search for, a search of depth 1 always completes, by default 1.0
+
+    Returns
+    -------
+    SearchResult
+        the best column (None if there are no legal moves),
+        its score, the deepest completed depth and the number of nodes visited
+    """
+    board = board.copy()
+    columns = list(board.legal_moves())
+    if not columns:
+        return SearchResult(None, 0, 0, 0)
+
+    for col in columns:
+        if board.is_winning_move(col):
+            return SearchResult(col, WIN_SCORE - board.moves, 1, 1)
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    searcher = _Search(None)
+    result = SearchResult(columns[0], 0, 0, 0)
+
+    for depth in range(1, max_depth + 1):
+        # the table carries over, so earlier iterations order the moves of later ones
+        searcher.deadline = deadline if depth > 1 else None
+        alpha, best_score, best_col = -INFINITY, -INFINITY, result.move
+        try:
+            for col in _ordered(result.move):
+                if not board.can_play(col):
+                    continue
+                board.play(col)
+                try:
+                    score = -searcher.negamax(board, depth - 1, -INFINITY, -alpha)
+                finally:
+                    board.undo(col)
+
+                if score > best_score:
+                    best_score, best_col = score, col
+                    alpha = max(alpha, score)
+        except _Timeout:
+            break
+
+        result = SearchResult(best_col, best_score, depth, searcher.nodes)
+        # a forced result was found, searching deeper cannot change it
+        if abs(best_score) > WIN_SCORE - WIDTH * HEIGHT - 1:
+            break
+
+    return result._replace(nodes=searcher.nodes)
+
+
+def best_move(board: Bitboard, difficulty: Difficulty = "medium") -> Optional[int]:
+    """
+    returns the column the bot plays at the given difficulty, or None if the board is full
+
+    Parameters
+    ----------
+    board : Bitboard
+        the position to play from
+    difficulty : Literal["easy", "medium", "hard", "expert"], optional
+        how deep and how long to search, by default "medium"
+    """
+    try:
+        max_depth, time_budget = DIFFICULTIES[difficulty]
+    except KeyError:
+        raise ValueError(
+            f"difficulty must be one of {', '.join(DIFFICULTIES)}, not {difficulty!r}"
+        ) from None
+    return search(board, max_depth=max_depth, time_budget=time_budget).move
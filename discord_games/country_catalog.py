@@ -0,0 +1,311 @@
+"""An index of the country assets, built once per process.
+
+Each image in a country folder is matched against ``assets/countries.json``
+for its region and aliases, so that games never list the folder or parse file names themselves.
+Guesses are matched against the normalised names and aliases, forgiving a typo or two.
+"""
+
+from __future__ import annotations
+
+from typing import Final, Iterable, Iterator, NamedTuple, Optional, TYPE_CHECKING
+import functools
+import json
+import pathlib
+import random
+import re
+import unicodedata
+
+if TYPE_CHECKING:
+    from typing import Literal
+    from typing_extensions import TypeAlias
+
+    Region: TypeAlias = Literal[
+        "africa", "americas", "antarctica", "asia", "europe", "oceania"
+    ]
+
+__all__: tuple[str, ...] = (
+    "REGIONS",
+    "Country",
+    "CountryCatalog",
+    "get_catalog",
+    "normalise",
+    "levenshtein",
+    "Match",
+    "accepted_lengths",
+)
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+REGIONS: Final[tuple[str, ...]] = (
+    "africa",
+    "americas",
+    "antarctica",
+    "asia",
+    "europe",
+    "oceania",
+)
+
+# the number of typos forgiven in a name of at least the given length
+TYPO_ALLOWANCE: Final[tuple[tuple[int, int], ...]] = ((9, 2), (5, 1))
+
+_NON_WORD: Final[re.Pattern[str]] = re.compile(r"[^\w\s]")
+_SPACES: Final[re.Pattern[str]] = re.compile(r"[\s_]+")
+
+
+def normalise(name: str) -> str:
+    """
+    reduces a country name to the form names are compared in:
+    casefolded, without accents or punctuation and with single spaces
+    """
+    name = unicodedata.normalize("NFKD", name.replace("&", " and "))
+    name = "".join(c for c in name if not unicodedata.combining(c)).casefold()
+    name = _NON_WORD.sub("", name)
+    return _SPACES.sub(" ", name).strip()
+
+
+@functools.lru_cache(maxsize=1024)
+def _char_masks(pattern: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | 1 << i
+    return masks
+
+
+def levenshtein(pattern: str, text: str) -> int:
+    """
+    computes the edit distance between two strings with Myers' bit-parallel algorithm,
+    one pass over ``text`` with the per-character masks of ``pattern`` cached between calls
+    """
+    length = len(pattern)
+    if not length:
+        return len(text)
+
+    masks = _char_masks(pattern)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    # the vertical deltas of the current column, +1 and -1 bits
+    pv, mv = full, 0
+    distance = length
+
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+
+        if ph & last:
+            distance += 1
+        elif mh & last:
+            distance -= 1
+
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return distance
+
+
+def allowed_typos(length: int) -> int:
+    """returns the number of typos forgiven in a name of the given length"""
+    for minimum, typos in TYPO_ALLOWANCE:
+        if length >= minimum:
+            return typos
+    return 0
+
+
+class Match(NamedTuple):
+    accepted: bool
+    # from 0 to 100, how close the guess was to the nearest name of the country
+    score: int
+    distance: int
+
+
+class Country(NamedTuple):
+    # the name shown to players, taken from the file name
+    name: str
+    # the normalised name and aliases, the first being the name itself
+    keys: tuple[str, ...]
+    region: Optional[str]
+    path: pathlib.Path
+    size: int
+
+
+def accepted_lengths(country: Country) -> frozenset[int]:
+    """
+    returns every length a guess may have and still be accepted for the country,
+    those of its display name and of each of its keys give or take the typos forgiven
+    """
+    most = max(typos for _, typos in TYPO_ALLOWANCE)
+    lengths = {len(country.name)}
+    for key in country.keys:
+        size = len(key)
+        lengths.update(
+            length
+            for length in range(max(size - most, 1), size + most + 1)
+            if abs(length - size) <= allowed_typos(length)
+        )
+    return frozenset(lengths)
+
+
+class CountryCatalog:
+    """The countries of one asset folder.
+
+    Obtain catalogs through :func:`get_catalog`, which builds each of them once.
+    """
+
+    def __init__(self, folder: pathlib.Path, metadata: dict[str, dict]) -> None:
+        self.folder = folder
+
+        # metadata is looked up by any of its normalised keys, as file names vary between folders
+        info: dict[str, dict] = {}
+        for name, entry in metadata.items():
+            for key in (name, *entry.get("aliases", ())):
+                info.setdefault(normalise(key), {"name": name, **entry})
+
+        countries = []
+        for path in sorted(folder.glob("*.png")):
+            key = normalise(path.stem)
+            entry = info.get(key, {})
+            aliases = (entry.get("name", path.stem), *entry.get("aliases", ()))
+            keys = tuple(dict.fromkeys((key, *map(normalise, aliases))))
+            countries.append(
+                Country(
+                    name=path.stem,
+                    keys=keys,
+                    region=entry.get("region"),
+                    path=path,
+                    size=path.stat().st_size,
+                )
+            )
+
+        self.countries: tuple[Country, ...] = tuple(countries)
+        self._lookup: dict[str, Country] = {}
+        for country in self.countries:
+            for key in country.keys:
+                self._lookup.setdefault(key, country)
+
+        self._by_regions: dict[frozenset[str], tuple[Country, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    def __iter__(self) -> Iterator[Country]:
+        return iter(self.countries)
+
+    def __repr__(self) -> str:
+        return f"<CountryCatalog folder={self.folder.name!r} countries={len(self)}>"
+
+    def in_regions(
+        self, regions: Optional[Iterable[str]] = None
+    ) -> tuple[Country, ...]:
+        """
+        returns the countries within the given regions, the selection being cached
+
+        Raises
+        ------
+        ValueError
+            an unknown region was given, or no country lies within the given regions
+        """
+        if regions is None:
+            return self.countries
+
+        key = frozenset(regions)
+        try:
+            return self._by_regions[key]
+        except KeyError:
+            pass
+
+        if unknown := key.difference(REGIONS):
+            raise ValueError(
+                f"regions must be among {', '.join(REGIONS)}, not {', '.join(sorted(unknown))}"
+            )
+
+        selection = tuple(c for c in self.countries if c.region in key)
+        if not selection:
+            raise ValueError(f"no countries lie within {', '.join(sorted(key))}")
+
+        self._by_regions[key] = selection
+        return selection
+
+    def sample(
+        self,
+        regions: Optional[Iterable[str]] = None,
+        *,
+        rng: Optional[random.Random] = None,
+    ) -> Country:
+        """picks a random country, optionally only within the given regions"""
+        return (rng or random).choice(self.in_regions(regions))
+
+    def find(self, name: str) -> Optional[Country]:
+        """returns the country going by the given name or alias, if any"""
+        return self._lookup.get(normalise(name))
+
+    def match(self, guess: str, country: Country) -> Match:
+        """
+        checks a guess against a country's name and aliases
+
+        A guess is accepted when it is one of the country's names once normalised,
+        or a few typos away from one of them without being the name of another country.
+        The closeness score of a rejected guess comes from its distance to the nearest name.
+
+        Parameters
+        ----------
+        guess : str
+            the player's guess
+        country : Country
+            the country to guess
+
+        Returns
+        -------
+        Match
+            whether or not the guess was accepted, its closeness score and edit distance
+        """
+        guess = normalise(guess)
+        named = self._lookup.get(guess)
+        if named == country:
+            return Match(True, 100, 0)
+
+        # the name of another country is never mistaken for a typo
+        allowance = allowed_typos(len(guess)) if named is None else 0
+
+        best: Optional[tuple[int, str]] = None
+        for key in country.keys:
+            # the length difference bounds the distance from below, skipping hopeless keys
+            if best is not None and abs(len(key) - len(guess)) >= best[0]:
+                continue
+
+            distance = levenshtein(key, guess)
+            if distance <= allowance:
+                return Match(True, 100, distance)
+            if best is None or distance < best[0]:
+                best = (distance, key)
+
+        assert best is not None
+        distance, key = best
+        length = max(len(key), len(guess))
+        return Match(False, round(100 * (1 - distance / length)), distance)
+
+
+@functools.lru_cache(maxsize=1)
+def _metadata() -> dict[str, dict]:
+    with open(ASSETS / "countries.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=2)
+def get_catalog(is_flags: bool = False) -> CountryCatalog:
+    """
+    returns the catalog of either the country flags or the country outlines
+
+    Parameters
+    ----------
+    is_flags : bool, optional
+        specifies whether to return the flags' catalog, by default False
+
+    Returns
+    -------
+    CountryCatalog
+        the shared catalog
+    """
+    folder = ASSETS / ("country-flags" if is_flags else "country-data")
+    return CountryCatalog(folder, _metadata())
@@ -1,30 +1,38 @@
 from __future__ import annotations
 
 import asyncio
-import difflib
 import os
 import pathlib
 import random
 
-from typing import Union, Optional
+from typing import Collection, Iterable, Union, Optional, TYPE_CHECKING
 from io import BytesIO
 
 import discord
 from discord.ext import commands
-from PIL import Image, ImageFilter, ImageOps
+from PIL import Image
 
 from .utils import DEFAULT_COLOR, DiscordColor, executor
+from .dispatcher import GameDispatcher
+from .country_images import blur, invert, cached_variant, get_variant
+from .country_catalog import Country, Match, accepted_lengths, get_catalog
+
+if TYPE_CHECKING:
+    from .country_catalog import Region
 
 
 class CountryGuesser:
     """Country guessing game, message-based.
 
     Shows a country's flag and the player guesses the name.
+    Any of the country's aliases are accepted, as are guesses off by a typo or two,
+    and ``regions`` limits the game to countries within those regions.
     """
 
     embed: discord.Embed
-    accepted_length: Optional[int]
+    accepted_lengths: Optional[frozenset[int]]
     country: str
+    country_info: Country
 
     def __init__(
         self,
@@ -34,6 +42,7 @@ class CountryGuesser:
         hard_mode: bool = False,
         guesses: int = 5,
         hints: int = 1,
+        regions: Optional[Iterable[Region]] = None,
     ) -> None:
         self.embed_color: Optional[DiscordColor] = None
         self.hints = hints
@@ -47,20 +56,13 @@ class CountryGuesser:
         else:
             self.light_mode: bool = light_mode
 
-        folder = "assets/country-flags" if self.is_flags else "assets/country-data"
-        self._countries_path = pathlib.Path(__file__).parent / folder
-
-        self.all_countries = os.listdir(self._countries_path)
+        self.catalog = get_catalog(self.is_flags)
+        self.all_countries: tuple[Country, ...] = self.catalog.in_regions(regions)
 
     @executor()
     def invert_image(self, image_path: Union[BytesIO, os.PathLike, str]) -> BytesIO:
         with Image.open(image_path) as img:
-            img = img.convert("RGBA")
-            r, g, b, a = img.split()
-            rgb = Image.merge("RGB", (r, g, b))
-            rgb = ImageOps.invert(rgb)
-            rgb = rgb.split()
-            img = Image.merge("RGBA", rgb + (a,))
+            img = invert(img.convert("RGBA"))
 
             buf = BytesIO()
             img.save(buf, "PNG")
@@ -70,25 +72,30 @@ class CountryGuesser:
     @executor()
     def blur_image(self, image_path: Union[BytesIO, os.PathLike, str]) -> BytesIO:
         with Image.open(image_path) as img:
-            img = img.convert("RGBA")
-            img = img.filter(ImageFilter.GaussianBlur(10))
+            img = blur(img.convert("RGBA"))
 
             buf = BytesIO()
             img.save(buf, "PNG")
             buf.seek(0)
             return buf
 
-    async def get_country(self) -> discord.File:
-        country_file = random.choice(self.all_countries)
-        self.country = country_file.strip()[:-4].lower()
+    @executor()
+    def _get_variant(self, source: pathlib.Path) -> Union[pathlib.Path, BytesIO]:
+        return get_variant(source, blurred=self.hard_mode, inverted=self.light_mode)
 
-        file = os.path.join(self._countries_path, country_file)
+    async def get_country(self) -> discord.File:
+        self.country_info = random.choice(self.all_countries)
+        self.country = self.country_info.name.lower()
 
-        if self.hard_mode:
-            file = await self.blur_image(file)
+        source = self.country_info.path
+        file: Union[pathlib.Path, BytesIO] = source
 
-        if self.light_mode:
-            file = await self.invert_image(file)
+        if self.hard_mode or self.light_mode:
+            # variants are processed once and then served from the disk cache
+            cached = cached_variant(
+                source, blurred=self.hard_mode, inverted=self.light_mode
+            )
+            file = cached if cached is not None else await self._get_variant(source)
 
         return discord.File(file, "country.png")
 
@@ -104,8 +111,21 @@ class CountryGuesser:
             blanks[idx] = self.country[idx]
         return " ".join(blanks)
 
+    def get_region_hint(self) -> str:
+        region = self.country_info.region
+        return f"\nIt lies in **{region.title()}**." if region else ""
+
+    def get_accepted_lengths(self) -> frozenset[int]:
+        return accepted_lengths(self.country_info)
+
+    def match(self, guess: str) -> Match:
+        return self.catalog.match(guess, self.country_info)
+
+    def is_correct(self, guess: str) -> bool:
+        return self.match(guess).accepted
+
     def get_accuracy(self, guess: str) -> int:
-        return round(difflib.SequenceMatcher(None, guess, self.country).ratio() * 100)
+        return self.match(guess).score
 
     def get_embed(self) -> discord.Embed:
         embed = discord.Embed(
@@ -126,20 +146,23 @@ class CountryGuesser:
         ctx: commands.Context[commands.Bot],
         *,
         options: tuple[str, ...] = (),
-        length: Optional[int] = None,
+        lengths: Optional[Collection[int]] = None,
     ) -> Optional[tuple[discord.Message, str]]:
         def check(m: discord.Message) -> bool:
-            if length:
+            if lengths:
                 return (
                     m.channel == ctx.channel
                     and m.author == ctx.author
-                    and len(m.content) == length
+                    and len(m.content.strip()) in lengths
                 )
             else:
                 return m.channel == ctx.channel and m.author == ctx.author
 
-        message: discord.Message = await ctx.bot.wait_for(
-            "message", timeout=self.timeout, check=check
+        message: discord.Message = await GameDispatcher.get(ctx.bot).wait_for_message(
+            channel=ctx.channel.id,
+            author=ctx.author.id,
+            check=check,
+            timeout=self.timeout,
         )
         content = message.content.strip().lower()
 
@@ -169,7 +192,7 @@ class CountryGuesser:
         embed_color : DiscordColor, optional
             the color of the game embed, by default DEFAULT_COLOR
         ignore_diff_len : bool, optional
-            specifies whether or not to ignore guesses that are not of the same length as the correct answer, by default False
+            specifies whether or not to ignore guesses whose length matches none of the country's names, typos forgiven, by default False
 
         Returns
         -------
@@ -185,11 +208,14 @@ class CountryGuesser:
 
         self.message = await ctx.send(embed=self.embed, file=file)
 
-        self.accepted_length = len(self.country) if ignore_diff_len else None
+        # any of the country's names is accepted, as are guesses off by a typo or two
+        self.accepted_lengths = self.get_accepted_lengths() if ignore_diff_len else None
 
         while not ctx.bot.is_closed():
             try:
-                result = await self.wait_for_response(ctx, length=self.accepted_length)
+                result = await self.wait_for_response(
+                    ctx, lengths=self.accepted_lengths
+                )
             except asyncio.TimeoutError:
                 break
 
@@ -197,7 +223,8 @@ class CountryGuesser:
                 continue
             msg, response = result
 
-            if response == self.country:
+            match = self.match(response)
+            if match.accepted:
                 await msg.reply(
                     f"That is correct! The country was `{self.country.title()}`"
                 )
@@ -211,7 +238,7 @@ class CountryGuesser:
                     )
                     break
 
-                acc = self.get_accuracy(response)
+                acc = match.score
 
                 if not self.hints:
                     await msg.reply(
@@ -238,7 +265,8 @@ class CountryGuesser:
                             hint = self.get_hint()
                             self.hints -= 1
                             await hint_msg.reply(
-                                f"Here is your hint: `{hint}`", mention_author=False
+                                f"Here is your hint: `{hint}`{self.get_region_hint()}",
+                                mention_author=False,
                             )
                         else:
                             await hint_msg.reply(
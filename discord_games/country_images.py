@@ -0,0 +1,231 @@
+"""A disk cache of the blurred and inverted country images.
+
+The assets never change at runtime, so every (image, blur, invert) variant is processed
+at most once and written under :func:`get_variant_cache_dir`; later rounds only read the file.
+:func:`build_variants` fills the cache ahead of time, e.g. on startup or as a build step.
+The cache directory is only trusted if it belongs to the current user and no one else may write to it;
+a cache that is not trusted or cannot be written to degrades to processing the image in memory.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Final, Iterable, Optional, Union
+import os
+import pathlib
+import tempfile
+
+from PIL import Image, ImageFilter, ImageOps
+
+__all__: tuple[str, ...] = (
+    "blur",
+    "invert",
+    "render_variant",
+    "cached_variant",
+    "get_variant",
+    "build_variants",
+    "get_variant_cache_dir",
+    "set_variant_cache_dir",
+)
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+# the (blurred, inverted) variants each asset folder is shown as, flags are never inverted
+VARIANTS: Final[dict[str, tuple[tuple[bool, bool], ...]]] = {
+    "country-data": ((True, False), (False, True), (True, True)),
+    "country-flags": ((True, False),),
+}
+BLUR_RADIUS: Final[int] = 10
+
+
+def _default_cache_dir() -> pathlib.Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = pathlib.Path.home() / ".cache"
+        except RuntimeError:
+            # no home directory, the trust check still refuses a directory someone else owns
+            base = tempfile.gettempdir()
+    return pathlib.Path(base) / "discord_games" / "country-variants"
+
+
+_cache_dir: pathlib.Path = _default_cache_dir()
+# whether or not the cache directory has been checked to be private, None until it was
+_cache_trusted: Optional[bool] = None
+
+
+def get_variant_cache_dir() -> pathlib.Path:
+    """returns the directory the processed variants are written to"""
+    return _cache_dir
+
+
+def set_variant_cache_dir(path: Union[os.PathLike, str]) -> None:
+    """
+    sets the directory the processed variants are written to,
+    by default ``discord_games/country-variants`` in ``$XDG_CACHE_HOME`` or ``~/.cache``
+
+    Parameters
+    ----------
+    path : Union[os.PathLike, str]
+        the directory to use, it is created when needed, readable by the current user only
+    """
+    global _cache_dir, _cache_trusted
+    _cache_dir = pathlib.Path(path)
+    _cache_trusted = None
+
+
+def _is_trusted() -> bool:
+    # variants are posted as is, so another user must not be able to plant or replace them
+    global _cache_trusted
+    if _cache_trusted is None:
+        try:
+            _cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            info = _cache_dir.stat()
+        except OSError:
+            return False
+
+        _cache_trusted = not info.st_mode & 0o022 and (
+            not hasattr(os, "getuid") or info.st_uid == os.getuid()
+        )
+    return _cache_trusted
+
+
+def blur(img: Image.Image) -> Image.Image:
+    """applies the hard mode gaussian blur to an RGBA image"""
+    return img.filter(ImageFilter.GaussianBlur(BLUR_RADIUS))
+
+
+def invert(img: Image.Image) -> Image.Image:
+    """inverts the colors of an RGBA image, leaving its transparency as is"""
+    r, g, b, a = img.split()
+    rgb = ImageOps.invert(Image.merge("RGB", (r, g, b)))
+    return Image.merge("RGBA", (*rgb.split(), a))
+
+
+def render_variant(
+    source: Union[BytesIO, os.PathLike, str], *, blurred: bool, inverted: bool
+) -> bytes:
+    """
+    processes an image into one of its variants, blurring before inverting
+
+    Parameters
+    ----------
+    source : Union[BytesIO, os.PathLike, str]
+        the image to process
+    blurred : bool
+        specifies whether or not to blur the image
+    inverted : bool
+        specifies whether or not to invert the colors of the image
+
+    Returns
+    -------
+    bytes
+        the processed image, encoded as PNG
+    """
+    with Image.open(source) as img:
+        img = img.convert("RGBA")
+        if blurred:
+            img = blur(img)
+        if inverted:
+            img = invert(img)
+
+        buf = BytesIO()
+        img.save(buf, "PNG")
+        return buf.getvalue()
+
+
+def _variant_path(source: pathlib.Path, blurred: bool, inverted: bool) -> pathlib.Path:
+    suffix = "".join(
+        name for name, flag in ((".blur", blurred), (".invert", inverted)) if flag
+    )
+    return _cache_dir / source.parent.name / f"{source.stem}{suffix}.png"
+
+
+def _is_fresh(path: pathlib.Path, source: pathlib.Path) -> bool:
+    try:
+        return path.stat().st_mtime >= source.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def cached_variant(
+    source: Union[os.PathLike, str], *, blurred: bool, inverted: bool
+) -> Optional[pathlib.Path]:
+    """returns the path of the variant if it has already been written, only costing a stat"""
+    source = pathlib.Path(source)
+    if not _is_trusted():
+        return None
+    path = _variant_path(source, blurred, inverted)
+    return path if _is_fresh(path, source) else None
+
+
+def get_variant(
+    source: Union[os.PathLike, str], *, blurred: bool, inverted: bool
+) -> Union[pathlib.Path, BytesIO]:
+    """
+    returns the variant of an image, processing and caching it on first use
+
+    Parameters
+    ----------
+    source : Union[os.PathLike, str]
+        the image to process
+    blurred : bool
+        specifies whether or not to blur the image
+    inverted : bool
+        specifies whether or not to invert the colors of the image
+
+    Returns
+    -------
+    Union[pathlib.Path, BytesIO]
+        the path of the cached variant, or the variant itself if the cache could not be written to
+    """
+    source = pathlib.Path(source)
+    if not (blurred or inverted):
+        return source
+
+    if not _is_trusted():
+        return BytesIO(render_variant(source, blurred=blurred, inverted=inverted))
+
+    path = _variant_path(source, blurred, inverted)
+    if _is_fresh(path, source):
+        return path
+
+    data = render_variant(source, blurred=blurred, inverted=inverted)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written under a unique name then renamed, so concurrent readers never see half a file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return BytesIO(data)
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+        return BytesIO(data)
+    return path
+
+
+def build_variants(folders: Iterable[str] = VARIANTS) -> int:
+    """
+    writes every variant of the country assets that is missing from the cache
+
+    Parameters
+    ----------
+    folders : Iterable[str], optional
+        the asset folders to process, by default both the outlines and the flags
+
+    Returns
+    -------
+    int
+        the number of variants that were written
+    """
+    written = 0
+    for folder in folders:
+        for source in sorted((ASSETS / folder).glob("*.png")):
+            for blurred, inverted in VARIANTS[folder]:
+                if cached_variant(source, blurred=blurred, inverted=inverted) is None:
+                    variant = get_variant(source, blurred=blurred, inverted=inverted)
+                    written += isinstance(variant, pathlib.Path)
+    return written
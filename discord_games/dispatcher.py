@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from typing import Any, Callable, ClassVar, Optional, Union, TYPE_CHECKING
+import asyncio
+import weakref
+
+import discord
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+    Key: TypeAlias = tuple[Optional[int], Optional[int]]
+    User: TypeAlias = Union[discord.User, discord.Member]
+
+__all__: tuple[str, ...] = ("GameDispatcher",)
+
+
+class _Waiter:
+    __slots__ = ("future", "check")
+
+    def __init__(self, future: asyncio.Future[Any], check: Callable[..., bool]) -> None:
+        self.future = future
+        self.check = check
+
+
+class GameDispatcher:
+    """Routes message and reaction events to the games waiting on them.
+
+    ``Client.wait_for`` runs the check of every pending waiter on every event,
+    so its cost grows with the number of running games.
+    The dispatcher registers a single listener per event type instead and indexes waiters
+    by (channel, author) for messages and (message, user) for reactions,
+    so only the checks of the few games an event could concern are ever ran.
+
+    Use :meth:`get` to obtain the dispatcher shared by every game of a bot.
+    """
+
+    _dispatchers: ClassVar[
+        weakref.WeakKeyDictionary[discord.Client, GameDispatcher]
+    ] = weakref.WeakKeyDictionary()
+
+    EVENTS: ClassVar[tuple[str, ...]] = ("message", "reaction_add", "reaction_remove")
+
+    def __init__(self, bot: discord.Client) -> None:
+        self.bot = bot
+        self._waiters: dict[str, dict[Key, list[_Waiter]]] = {
+            event: {} for event in self.EVENTS
+        }
+
+        # plain clients have no way of adding listeners, so they fall back to `wait_for`
+        self._listening: bool = hasattr(bot, "add_listener")
+        if self._listening:
+            bot.add_listener(self._on_message, "on_message")  # type: ignore[attr-defined]
+            bot.add_listener(self._on_reaction_add, "on_reaction_add")  # type: ignore[attr-defined]
+            bot.add_listener(self._on_reaction_remove, "on_reaction_remove")  # type: ignore[attr-defined]
+
+    @classmethod
+    def get(cls, bot: discord.Client) -> GameDispatcher:
+        """returns the dispatcher of the given bot, creating it on first use"""
+        try:
+            return cls._dispatchers[bot]
+        except KeyError:
+            dispatcher = cls._dispatchers[bot] = cls(bot)
+            return dispatcher
+
+    @property
+    def pending(self) -> int:
+        """the number of waits currently in progress"""
+        return len(
+            {
+                waiter
+                for index in self._waiters.values()
+                for waiters in index.values()
+                for waiter in waiters
+            }
+        )
+
+    def _dispatch(self, event: str, keys: tuple[Key, ...], *args: Any) -> None:
+        index = self._waiters[event]
+        for key in keys:
+            waiters = index.get(key)
+            if not waiters:
+                continue
+
+            for waiter in tuple(waiters):
+                if waiter.future.done():
+                    continue
+                try:
+                    result = waiter.check(*args)
+                except Exception as exc:
+                    waiter.future.set_exception(exc)
+                else:
+                    if result:
+                        waiter.future.set_result(args[0] if len(args) == 1 else args)
+
+    async def _on_message(self, message: discord.Message) -> None:
+        channel, author = message.channel.id, message.author.id
+        self._dispatch(
+            "message",
+            ((channel, author), (channel, None), (None, author)),
+            message,
+        )
+
+    async def _on_reaction(
+        self, event: str, reaction: discord.Reaction, user: User
+    ) -> None:
+        message = reaction.message.id
+        self._dispatch(event, ((message, user.id), (message, None)), reaction, user)
+
+    async def _on_reaction_add(self, reaction: discord.Reaction, user: User) -> None:
+        await self._on_reaction("reaction_add", reaction, user)
+
+    async def _on_reaction_remove(self, reaction: discord.Reaction, user: User) -> None:
+        await self._on_reaction("reaction_remove", reaction, user)
+
+    async def _wait(
+        self,
+        events: tuple[str, ...],
+        key: Key,
+        check: Callable[..., bool],
+        timeout: Optional[float],
+    ) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(future, check)
+
+        for event in events:
+            self._waiters[event].setdefault(key, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            for event in events:
+                index = self._waiters[event]
+                waiters = index.get(key)
+                if waiters is not None:
+                    try:
+                        waiters.remove(waiter)
+                    except ValueError:
+                        pass
+                    if not waiters:
+                        del index[key]
+
+    async def _fallback(
+        self,
+        events: tuple[str, ...],
+        check: Callable[..., bool],
+        timeout: Optional[float],
+    ) -> Any:
+        tasks = [
+            asyncio.ensure_future(
+                self.bot.wait_for(event, check=check, timeout=timeout)
+            )
+            for event in events
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return done.pop().result()
+
+    async def wait_for_message(
+        self,
+        *,
+        channel: Optional[int] = None,
+        author: Optional[int] = None,
+        check: Optional[Callable[[discord.Message], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> discord.Message:
+        """
+        waits for a message in the given channel and/or from the given author
+
+        Parameters
+        ----------
+        channel : Optional[int], optional
+            the id of the channel to wait in, by default None
+        author : Optional[int], optional
+            the id of the author to wait for, by default None
+        check : Optional[Callable[[discord.Message], bool]], optional
+            an additional predicate the message must pass, by default None
+        timeout : Optional[float], optional
+            the timeout for when waiting, by default None
+
+        Returns
+        -------
+        discord.Message
+            returns the message
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            the timeout was reached
+        """
+        if channel is None and author is None:
+            raise TypeError("At least one of channel or author must be given")
+
+        def predicate(message: discord.Message) -> bool:
+            return check is None or check(message)
+
+        if not self._listening:
+
+            def fallback(message: discord.Message) -> bool:
+                return (
+                    (channel is None or message.channel.id == channel)
+                    and (author is None or message.author.id == author)
+                    and predicate(message)
+                )
+
+            return await self._fallback(("message",), fallback, timeout)
+
+        return await self._wait(("message",), (channel, author), predicate, timeout)
+
+    async def wait_for_reaction(
+        self,
+        *,
+        message: int,
+        user: Optional[int] = None,
+        check: Optional[Callable[[discord.Reaction, User], bool]] = None,
+        timeout: Optional[float] = None,
+        remove: bool = False,
+    ) -> tuple[discord.Reaction, User]:
+        """
+        waits for a reaction on the given message, optionally from the given user
+
+        Parameters
+        ----------
+        message : int
+            the id of the message to wait on
+        user : Optional[int], optional
+            the id of the user to wait for, by default None
+        check : Optional[Callable[[discord.Reaction, User], bool]], optional
+            an additional predicate the reaction must pass, by default None
+        timeout : Optional[float], optional
+            the timeout for when waiting, by default None
+        remove : bool, optional
+            specifies whether or not removing a reaction counts as well, by default False
+
+        Returns
+        -------
+        tuple[discord.Reaction, User]
+            returns the reaction and the user who reacted
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            the timeout was reached
+        """
+        events = ("reaction_add", "reaction_remove") if remove else ("reaction_add",)
+
+        def predicate(reaction: discord.Reaction, reactor: User) -> bool:
+            return check is None or check(reaction, reactor)
+
+        if not self._listening:
+
+            def fallback(reaction: discord.Reaction, reactor: User) -> bool:
+                return (
+                    reaction.message.id == message
+                    and (user is None or reactor.id == user)
+                    and predicate(reaction, reactor)
+                )
+
+            return await self._fallback(events, fallback, timeout)
+
+        return await self._wait(events, (message, user), predicate, timeout)
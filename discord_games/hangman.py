@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from typing import Optional, Final
-import random
 import string
 import asyncio
 
 import discord
 from discord.ext import commands
-from english_words import get_english_words_set
 
 from .utils import DiscordColor, DEFAULT_COLOR
+from .dispatcher import GameDispatcher
+from .lexicon import get_lexicon
 
 BLANK: Final[str] = "  \u200b"
 STAGES: Final[tuple[str, ...]] = (
@@ -106,13 +106,7 @@ class Hangman:
 
     def __init__(self, word: Optional[str] = None) -> None:
         self._alpha: list[str] = list(string.ascii_lowercase)
-        self._all_words = tuple(
-            get_english_words_set(
-                ["web2"],
-                alpha=True,
-                lower=True,
-            )
-        )
+        self._all_words = get_lexicon("web2")
 
         if word:
             if not word.isalpha():
@@ -134,10 +128,7 @@ class Hangman:
         self.game_over: bool = False
 
     def get_word(self) -> str:
-        word = random.choice(self._all_words).lower()
-        if len(word) == 1:
-            word = self.get_word()
-        return word
+        return self._all_words.random(min_length=2).lower()
 
     def lives(self) -> str:
         return f"`{('❤️' * self._counter) or '💀'} ({self._counter})`"
@@ -244,8 +235,13 @@ class Hangman:
                 return False
 
             try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", timeout=timeout, check=check
+                message: discord.Message = await GameDispatcher.get(
+                    ctx.bot
+                ).wait_for_message(
+                    channel=ctx.channel.id,
+                    author=self.player.id,
+                    check=check,
+                    timeout=timeout,
                 )
             except asyncio.TimeoutError:
                 break
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from typing import (
+    Callable,
+    ClassVar,
+    Final,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+import bisect
+import collections
+import itertools
+import pathlib
+import random
+import sys
+import threading
+
+from english_words import get_english_words_set
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+__all__: tuple[str, ...] = (
+    "Lexicon",
+    "WordValidator",
+    "get_lexicon",
+    "register_lexicon",
+    "warm_up",
+    "lexicon_stats",
+)
+
+Loader: TypeAlias = Callable[[], Iterable[str]]
+Difficulty: TypeAlias = Literal["easy", "medium", "hard"]
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+
+
+class _LengthIndex:
+    """Words ordered by length, then alphabetically.
+
+    Every length occupies a contiguous run of the tuple,
+    so any range of lengths maps to a single index range to sample from.
+    """
+
+    __slots__ = ("words", "lengths", "starts")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: tuple[str, ...] = tuple(sorted(words, key=lambda w: (len(w), w)))
+        # the distinct lengths in ascending order, and the index their run starts at
+        self.lengths: list[int] = []
+        self.starts: list[int] = []
+
+        for i, word in enumerate(self.words):
+            if not self.lengths or len(word) != self.lengths[-1]:
+                self.lengths.append(len(word))
+                self.starts.append(i)
+
+    def span(self, min_length: int, max_length: Optional[int]) -> tuple[int, int]:
+        lo = bisect.bisect_left(self.lengths, min_length)
+        hi = (
+            len(self.lengths)
+            if max_length is None
+            else bisect.bisect_right(self.lengths, max_length)
+        )
+        end = self.starts[hi] if hi < len(self.starts) else len(self.words)
+        start = self.starts[lo] if lo < len(self.starts) else len(self.words)
+        return start, max(start, end)
+
+
+class Lexicon:
+    """An immutable, shared word list.
+
+    Holds a frozenset for membership checks, a sorted tuple
+    and lazily built length-ordered indexes for constant time random sampling,
+    optionally restricted to a range of lengths or to a difficulty tier.
+    Instances are meant to be shared between games, obtain them through :func:`get_lexicon`.
+    """
+
+    DIFFICULTIES: ClassVar[tuple[Difficulty, ...]] = ("easy", "medium", "hard")
+
+    __slots__ = ("name", "words", "sorted_words", "_index", "_tiers")
+
+    def __init__(self, name: str, words: Iterable[str]) -> None:
+        self.name = name
+        self.words: frozenset[str] = frozenset(words)
+        self.sorted_words: tuple[str, ...] = tuple(sorted(self.words))
+        self._index: Optional[_LengthIndex] = None
+        self._tiers: Optional[dict[Difficulty, _LengthIndex]] = None
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.sorted_words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sorted_words)
+
+    def __repr__(self) -> str:
+        return f"<Lexicon name={self.name!r} size={len(self)}>"
+
+    def _build_tiers(self) -> dict[Difficulty, _LengthIndex]:
+        # words made of common letters are easier to type and recognise
+        counts = collections.Counter(itertools.chain.from_iterable(self.sorted_words))
+        total = sum(counts.values()) or 1
+
+        def commonness(word: str) -> float:
+            return sum(counts[char] for char in word) / (total * (len(word) or 1))
+
+        ranked = sorted(self.sorted_words, key=commonness, reverse=True)
+        size = -(-len(ranked) // len(self.DIFFICULTIES))
+        return {
+            tier: _LengthIndex(ranked[i * size : (i + 1) * size])
+            for i, tier in enumerate(self.DIFFICULTIES)
+        }
+
+    def _get_index(self, difficulty: Optional[Difficulty] = None) -> _LengthIndex:
+        if difficulty is None:
+            if self._index is None:
+                self._index = _LengthIndex(self.sorted_words)
+            return self._index
+
+        if difficulty not in self.DIFFICULTIES:
+            raise ValueError(
+                f"difficulty must be one of {', '.join(self.DIFFICULTIES)}, not {difficulty!r}"
+            )
+        if self._tiers is None:
+            self._tiers = self._build_tiers()
+        return self._tiers[difficulty]
+
+    def of_length(self, length: int) -> tuple[str, ...]:
+        """returns every word of exactly the given length, in sorted order"""
+        index = self._get_index()
+        start, end = index.span(length, length)
+        return index.words[start:end]
+
+    def random(
+        self,
+        *,
+        min_length: int = 1,
+        max_length: Optional[int] = None,
+        difficulty: Optional[Difficulty] = None,
+    ) -> str:
+        """picks a random word whose length lies within the given bounds"""
+        return self.sample(
+            1, min_length=min_length, max_length=max_length, difficulty=difficulty
+        )[0]
+
+    def sample(
+        self,
+        k: int,
+        *,
+        min_length: int = 1,
+        max_length: Optional[int] = None,
+        difficulty: Optional[Difficulty] = None,
+    ) -> list[str]:
+        """
+        picks ``k`` random words (with replacement) matching the given filters
+
+        Parameters
+        ----------
+        k : int
+            the number of words to pick
+        min_length : int, optional
+            the minimum length of the words, by default 1
+        max_length : Optional[int], optional
+            the maximum length of the words, by default None
+        difficulty : Optional[Literal["easy", "medium", "hard"]], optional
+            the difficulty tier to pick from, by default None
+
+        Returns
+        -------
+        list[str]
+            the picked words
+        """
+        if difficulty is None and min_length <= 1 and max_length is None:
+            return random.choices(self.sorted_words, k=k)
+
+        index = self._get_index(difficulty)
+        start, end = index.span(min_length, max_length)
+        if start == end:
+            raise ValueError(f"{self.name!r} has no words matching the given filters")
+
+        words = index.words
+        return [words[random.randrange(start, end)] for _ in range(k)]
+
+    def memory_footprint(self) -> int:
+        """returns an approximation of the memory held by this lexicon, in bytes"""
+        size = sys.getsizeof(self.words) + sys.getsizeof(self.sorted_words)
+        size += sum(sys.getsizeof(word) for word in self.sorted_words)
+
+        indexes = list(self._tiers.values()) if self._tiers is not None else []
+        if self._index is not None:
+            indexes.append(self._index)
+        size += sum(sys.getsizeof(index.words) for index in indexes)
+        return size
+
+
+class WordValidator:
+    """Validates guesses against a word list in constant time.
+
+    Custom word lists are normalized to lowercase and hashed once,
+    so a single validator can be shared by any number of games.
+    """
+
+    __slots__ = ("lexicon", "length")
+
+    def __init__(
+        self,
+        words: Union[Lexicon, Iterable[str]],
+        *,
+        length: Optional[int] = None,
+    ) -> None:
+        if not isinstance(words, Lexicon):
+            words = Lexicon("custom", (word.strip().lower() for word in words))
+
+        if length is not None and len(words.of_length(length)) != len(words):
+            raise ValueError(f"Every word must be of length {length}")
+
+        self.lexicon: Lexicon = words
+        self.length = length
+
+    def __call__(self, word: str) -> bool:
+        return word.lower() in self.lexicon.words
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self(word)
+
+    def __repr__(self) -> str:
+        return f"<WordValidator lexicon={self.lexicon!r} length={self.length}>"
+
+
+def _load_wordle() -> Iterable[str]:
+    with open(ASSETS / "words.txt", "r") as f:
+        return f.read().splitlines()
+
+
+def _load_web2() -> Iterable[str]:
+    return get_english_words_set(["web2"], alpha=True, lower=True)
+
+
+_LOADERS: dict[str, Loader] = {
+    "wordle": _load_wordle,
+    "web2": _load_web2,
+}
+_LEXICONS: dict[str, Lexicon] = {}
+_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def register_lexicon(name: str, loader: Loader, *, replace: bool = False) -> None:
+    """
+    registers a word list under the given name, it is only loaded on first use
+
+    Parameters
+    ----------
+    name : str
+        the name to register the word list under
+    loader : Callable[[], Iterable[str]]
+        a callable returning the words of the list
+    replace : bool, optional
+        whether or not to replace an existing word list of the same name, by default False
+    """
+    with _LOCK:
+        if name in _LOADERS and not replace:
+            raise ValueError(f"A lexicon named {name!r} is already registered")
+        _LOADERS[name] = loader
+        _LEXICONS.pop(name, None)
+
+
+def get_lexicon(name: str) -> Lexicon:
+    """
+    returns the shared lexicon for the given name, loading it if necessary
+
+    Parameters
+    ----------
+    name : str
+        the name of the word list, ``"wordle"`` and ``"web2"`` are built in
+
+    Returns
+    -------
+    Lexicon
+        the process-wide lexicon
+    """
+    try:
+        return _LEXICONS[name]
+    except KeyError:
+        pass
+
+    with _LOCK:
+        if name not in _LEXICONS:
+            try:
+                loader = _LOADERS[name]
+            except KeyError:
+                raise KeyError(f"No lexicon named {name!r} is registered") from None
+            _LEXICONS[name] = Lexicon(name, loader())
+        return _LEXICONS[name]
+
+
+def warm_up(*names: str) -> None:
+    """
+    loads the given lexicons ahead of time (every registered one if none are given),
+    meant to be called once when the bot boots
+    """
+    for name in names or tuple(_LOADERS):
+        get_lexicon(name)
+
+
+def lexicon_stats() -> dict[str, dict[str, int]]:
+    """returns the size and approximate memory footprint of every loaded lexicon"""
+    return {
+        name: {"words": len(lexicon), "bytes": lexicon.memory_footprint()}
+        for name, lexicon in _LEXICONS.items()
+    }
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Final, Optional, TypedDict, TYPE_CHECKING
+import asyncio
+import functools
+import pathlib
+import random
+
+import aiohttp
+
+if TYPE_CHECKING:
+
+    class QuoteAPIResponse(TypedDict):
+        quote: str
+        id: int
+
+
+__all__: tuple[str, ...] = (
+    "QuoteBuffer",
+    "get_quote_buffer",
+    "get_session",
+    "close_quote_buffers",
+    "offline_quotes",
+)
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+
+DEFAULT_URL: Final[str] = "https://dummyjson.com/quotes/random"
+# seconds to wait before contacting an upstream again after it failed
+RETRY_AFTER: Final[float] = 30.0
+
+_session: Optional[aiohttp.ClientSession] = None
+_buffers: dict[str, QuoteBuffer] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def offline_quotes() -> tuple[str, ...]:
+    """returns the bundled quotes used when the upstream cannot be reached"""
+    with open(ASSETS / "quotes.txt", "r", encoding="utf-8") as f:
+        return tuple(line.strip() for line in f if line.strip())
+
+
+def get_session() -> aiohttp.ClientSession:
+    """returns the HTTP session shared by every game, (re)creating it if necessary"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+    return _session
+
+
+class QuoteBuffer:
+    """A ring buffer of quotes prefetched from an HTTP endpoint.
+
+    Quotes are handed out from the buffer, which is refilled in the background,
+    so a race never waits on the upstream unless the buffer has ran dry.
+    When the upstream fails, quotes are drawn from :func:`offline_quotes`
+    and the upstream is left alone for ``retry_after`` seconds.
+
+    Obtain buffers through :func:`get_quote_buffer` so that they are shared between games.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        *,
+        size: int = 8,
+        timeout: float = 5.0,
+        retry_after: float = RETRY_AFTER,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.url = url
+        self.size = size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retry_after = retry_after
+
+        self._quotes: deque[str] = deque(maxlen=size)
+        self._session = session
+        self._refill_task: Optional[asyncio.Task[None]] = None
+        self._down_until: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def __repr__(self) -> str:
+        return f"<QuoteBuffer url={self.url!r} buffered={len(self)}/{self.size}>"
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_session()
+
+    def parse(self, data: QuoteAPIResponse) -> str:
+        """extracts the quote from the JSON response of the upstream"""
+        return data.get("quote", "").replace("\n", " ").strip()
+
+    def _is_down(self) -> bool:
+        return asyncio.get_running_loop().time() < self._down_until
+
+    async def fetch(self) -> Optional[str]:
+        """fetches a single quote from the upstream, returning None if that failed"""
+        try:
+            async with self.session.get(self.url, timeout=self.timeout) as r:
+                if r.ok:
+                    if quote := self.parse(await r.json()):
+                        return quote
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+
+        self._down_until = asyncio.get_running_loop().time() + self.retry_after
+        return None
+
+    async def _refill(self) -> None:
+        while len(self._quotes) < self.size and not self._is_down():
+            quote = await self.fetch()
+            if quote is not None:
+                self._quotes.append(quote)
+
+    def refill(self) -> None:
+        """starts refilling the buffer in the background, if it isn't already"""
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def get(self) -> str:
+        """returns a quote, from the buffer if possible, falling back to the offline corpus"""
+        try:
+            quote = self._quotes.popleft()
+        except IndexError:
+            quote = None if self._is_down() else await self.fetch()
+
+        self.refill()
+        return quote if quote is not None else random.choice(offline_quotes())
+
+    async def close(self) -> None:
+        """stops refilling and drops every buffered quote"""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+        self._quotes.clear()
+
+
+def get_quote_buffer(url: str = DEFAULT_URL) -> QuoteBuffer:
+    """returns the shared quote buffer for the given url, creating it on first use"""
+    try:
+        return _buffers[url]
+    except KeyError:
+        buffer = _buffers[url] = QuoteBuffer(url)
+        return buffer
+
+
+async def close_quote_buffers() -> None:
+    """stops every shared buffer and closes the shared session, meant to be called on shutdown"""
+    global _session
+    for buffer in _buffers.values():
+        await buffer.close()
+    _buffers.clear()
+
+    if _session is not None:
+        await _session.close()
+        _session = None
@@ -9,6 +9,7 @@ import discord
 from discord.ext import commands
 
 from .utils import DiscordColor, DEFAULT_COLOR, Player
+from .dispatcher import GameDispatcher
 
 
 class ReactionGame:
@@ -37,7 +38,9 @@ class ReactionGame:
                 and not user.bot
             )
 
-        _, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check)
+        _, user = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+            message=self.message.id, check=check, timeout=timeout
+        )
         elapsed = time.perf_counter() - start_time
 
         return user, elapsed
@@ -7,7 +7,8 @@ from typing import ClassVar, Optional
 import discord
 from discord.ext import commands
 
-from .utils import DiscordColor, DEFAULT_COLOR, double_wait
+from .utils import DiscordColor, DEFAULT_COLOR
+from .dispatcher import GameDispatcher
 
 
 class RockPaperScissors:
@@ -38,11 +39,13 @@ class RockPaperScissors:
                 and reaction.message.id == self.message.id
             )
 
-        done, _ = await double_wait(
-            ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-            ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+        reaction, _ = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+            message=self.message.id,
+            user=ctx.author.id,
+            check=check,
+            timeout=timeout,
+            remove=True,
         )
-        reaction, _ = done.pop().result()
         return str(reaction.emoji)
 
     async def start(
@@ -7,7 +7,7 @@ from typing import Optional
 import discord
 from discord.ext import commands
 
-from .utils import double_wait
+from .dispatcher import GameDispatcher
 
 
 class Tetris:
@@ -291,11 +291,13 @@ class Tetris:
 
         while not ctx.bot.is_closed():
             try:
-                done, _ = await double_wait(
-                    ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-                    ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+                reaction, _ = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+                    message=self.message.id,
+                    user=ctx.author.id,
+                    check=check,
+                    timeout=timeout,
+                    remove=True,
                 )
-                reaction, _ = done.pop().result()
             except asyncio.TimeoutError:
                 await self._end_game("Game timed out due to inactivity.")
                 return self.message
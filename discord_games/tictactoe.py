@@ -1,18 +1,28 @@
 from __future__ import annotations
 
-from typing import Optional, ClassVar
+from typing import Final, Optional, ClassVar
 import asyncio
 
 import discord
 from discord.ext import commands
 
-from .utils import DiscordColor, DEFAULT_COLOR, Player, double_wait
+from .utils import DiscordColor, DEFAULT_COLOR, Player
+from .dispatcher import GameDispatcher
+from . import tictactoe_engine as engine
+
+# difficulty -> the probability of the bot playing a random cell instead of a perfect one
+DIFFICULTIES: Final[dict[str, float]] = {
+    "easy": 0.6,
+    "medium": 0.25,
+    "impossible": 0.0,
+}
 
 
 class Tictactoe:
     """Tic-Tac-Toe, reaction-based.
 
     Two players take turns placing marks on a 3x3 grid.
+    Leaving out ``circle`` makes the bot play circle.
     """
 
     BLANK: ClassVar[str] = "⬛"
@@ -30,33 +40,33 @@ class Tictactoe:
         "9️⃣": (2, 2),
     }
 
-    _WINNERS: ClassVar[tuple[tuple[tuple[int, int], ...], ...]] = (
-        ((0, 0), (0, 1), (0, 2)),
-        ((1, 0), (1, 1), (1, 2)),
-        ((2, 0), (2, 1), (2, 2)),
-        ((0, 0), (1, 0), (2, 0)),
-        ((0, 1), (1, 1), (2, 1)),
-        ((0, 2), (1, 2), (2, 2)),
-        ((0, 0), (1, 1), (2, 2)),
-        ((0, 2), (1, 1), (2, 0)),
-    )
-
     def __init__(
         self,
         cross: Player,
-        circle: Player,
+        circle: Optional[Player] = None,
+        *,
+        difficulty: str = "impossible",
     ) -> None:
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(
+                f"difficulty must be one of {', '.join(DIFFICULTIES)}, not {difficulty!r}"
+            )
+
         self.cross = cross
         self.circle = circle
+        self.vs_bot: bool = circle is None
+        self.difficulty = difficulty
 
         self.board: list[list[str]] = [[self.BLANK for _ in range(3)] for _ in range(3)]
+        # the cells held by cross and circle respectively
+        self.masks: list[int] = [0, 0]
         self.turn: Player = self.cross
 
         self.winner: Optional[Player] = None
         self.winning_indexes: tuple[tuple[int, int], ...] = ()
         self.message: Optional[discord.Message] = None
 
-        self._controls: list[str] = [
+        self._controls: tuple[str, ...] = (
             "1️⃣",
             "2️⃣",
             "3️⃣",
@@ -66,16 +76,26 @@ class Tictactoe:
             "7️⃣",
             "8️⃣",
             "9️⃣",
-        ]
+        )
+        # the controls of the cells still free
+        self._remaining: set[str] = set(self._controls)
+
+        self._assign_pieces()
 
-        self.emoji_to_player: dict[str, Player] = {
+    def _assign_pieces(self) -> None:
+        self.emoji_to_player: dict[str, Optional[Player]] = {
             self.CIRCLE: self.circle,
             self.CROSS: self.cross,
         }
-        self.player_to_emoji: dict[Player, str] = {
+        self.player_to_emoji: dict[Optional[Player], str] = {
             v: k for k, v in self.emoji_to_player.items()
         }
 
+    def _bind_bot(self, ctx: commands.Context[commands.Bot]) -> None:
+        if self.vs_bot and self.circle is None:
+            self.circle = ctx.me  # type: ignore[assignment]
+            self._assign_pieces()
+
     def board_string(self) -> str:
         board = ""
         for row in self.board:
@@ -91,32 +111,49 @@ class Tictactoe:
             embed.description = f"**Turn:** {self.turn.mention}\n**Piece:** `{self.player_to_emoji[self.turn]}`"
         return embed
 
+    def place(self, row: int, col: int, user: Player) -> None:
+        """places the user's mark at the given cell and passes the turn"""
+        self.board[row][col] = self.player_to_emoji[user]
+        self.masks[user != self.cross] |= 1 << (3 * row + col)
+
+        self._remaining.discard(self._controls[3 * row + col])
+        self.turn = self.circle if user == self.cross else self.cross  # type: ignore[assignment]
+
     def make_move(self, emoji: str, user: Player) -> list:
-        if emoji not in self._controls:
+        if emoji not in self._remaining:
             raise KeyError("Provided emoji is not one of the valid controls")
         else:
             x, y = self._conversion[emoji]
-            piece = self.player_to_emoji[user]
-            self.board[x][y] = piece
-
-            self.turn = self.circle if user == self.cross else self.cross
-            self._conversion.pop(emoji)
-            self._controls.remove(emoji)
+            self.place(x, y, user)
             return self.board
 
-    def is_game_over(self, *, tie: bool = False) -> bool:
-        for possibility in self._WINNERS:
-            row = [self.board[r][c] for r, c in possibility]
+    def play_bot_move(self) -> Optional[tuple[int, int]]:
+        """
+        plays the bot's move, looked up from the perfect-play table
 
-            if len(set(row)) == 1 and row[0] != self.BLANK:
-                self.winner = self.emoji_to_player[row[0]]
-                self.winning_indexes = possibility
-                return True
+        Returns
+        -------
+        Optional[tuple[int, int]]
+            the (row, col) played, or None if the game is already over
+        """
+        cell = engine.best_move(*self.masks, mistake_rate=DIFFICULTIES[self.difficulty])
+        if cell is None:
+            return None
+
+        row, col = divmod(cell, 3)
+        self.place(row, col, self.turn)
+        return row, col
+
+    def is_game_over(self, *, tie: bool = False) -> bool:
+        cross, circle = self.masks
+        line = engine.winning_line(cross, circle)
 
-        if not self._controls or tie:
+        if line is not None:
+            self.winner = self.cross if cross & line == line else self.circle
+            self.winning_indexes = engine.cells(line)
             return True
 
-        return False
+        return cross | circle == engine.FULL or tie
 
     async def start(
         self,
@@ -147,6 +184,7 @@ class Tictactoe:
             returns the game emssage
         """
         self.embed_color = embed_color
+        self._bind_bot(ctx)
 
         embed = self.make_embed()
         self.message = await ctx.send(self.board_string(), embed=embed, **kwargs)
@@ -158,24 +196,25 @@ class Tictactoe:
 
             def check(reaction: discord.Reaction, user: discord.User) -> bool:
                 return (
-                    str(reaction.emoji) in self._controls
+                    str(reaction.emoji) in self._remaining
                     and user == self.turn
                     and self.message is not None
                     and reaction.message.id == self.message.id
                 )
 
             try:
-                done, _ = await double_wait(
-                    ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-                    ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+                reaction, user = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+                    message=self.message.id,
+                    user=self.turn.id,
+                    check=check,
+                    timeout=timeout,
+                    remove=True,
                 )
-                reaction, user = done.pop().result()
             except asyncio.TimeoutError:
                 break
 
             emoji = str(reaction.emoji)
             self.make_move(emoji, user)
-            embed = self.make_embed()
 
             if remove_reaction_after:
                 await self.message.remove_reaction(emoji, user)
@@ -183,6 +222,13 @@ class Tictactoe:
             if self.is_game_over():
                 break
 
+            if self.vs_bot:
+                self.play_bot_move()
+                if self.is_game_over():
+                    break
+
+            embed = self.make_embed()
+
             await self.message.edit(content=self.board_string(), embed=embed)
 
         embed = self.make_embed(game_over=True)
@@ -0,0 +1,169 @@
+"""A perfect-play table for Tic-Tac-Toe.
+
+A position is a pair of 9-bit masks, one per player,
+the cell at ``(row, col)`` being bit ``3 * row + col``.
+Every position reachable from the empty board (5478 of them) is solved once, on first use,
+into a table holding its winning line, its outcome and the moves that achieve it.
+"""
+
+from __future__ import annotations
+
+from typing import Final, NamedTuple, Optional
+import random
+import threading
+
+__all__: tuple[str, ...] = (
+    "LINES",
+    "Entry",
+    "lookup",
+    "winning_line",
+    "best_move",
+    "cells",
+)
+
+FULL: Final[int] = 0b111_111_111
+
+LINES: Final[tuple[int, ...]] = (
+    0b000_000_111,
+    0b000_111_000,
+    0b111_000_000,
+    0b001_001_001,
+    0b010_010_010,
+    0b100_100_100,
+    0b100_010_001,
+    0b001_010_100,
+)
+
+# cells are tried center first, then corners, so the best moves are listed in that order
+ORDER: Final[tuple[int, ...]] = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+
+class Entry(NamedTuple):
+    # the completed line, if any
+    line: Optional[int]
+    # 1 if the player to move wins with perfect play, 0 for a draw and -1 for a loss
+    outcome: int
+    # every cell reaching the outcome, empty for finished games
+    moves: tuple[int, ...]
+
+
+_TABLE: dict[tuple[int, int], Entry] = {}
+_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _line_of(pieces: int) -> Optional[int]:
+    for line in LINES:
+        if pieces & line == line:
+            return line
+    return None
+
+
+def _solve(mover: int, other: int) -> Entry:
+    # keyed by (player to move, opponent), as the outcome is relative to the mover
+    key = (mover, other)
+    if (entry := _TABLE.get(key)) is not None:
+        return entry
+
+    # only the player who just moved can have completed a line
+    line = _line_of(other)
+    if line is not None:
+        entry = Entry(line, -1, ())
+    elif mover | other == FULL:
+        entry = Entry(None, 0, ())
+    else:
+        outcomes: dict[int, int] = {}
+        for cell in ORDER:
+            bit = 1 << cell
+            if not (mover | other) & bit:
+                outcomes[cell] = -_solve(other, mover | bit).outcome
+
+        best = max(outcomes.values())
+        entry = Entry(None, best, tuple(c for c, o in outcomes.items() if o == best))
+
+    _TABLE[key] = entry
+    return entry
+
+
+def _build_table() -> None:
+    with _LOCK:
+        if not _TABLE:
+            _solve(0, 0)
+
+
+def _key(cross: int, circle: int) -> tuple[int, int]:
+    # cross always moves first, so it is to move whenever both have placed equally
+    if bin(cross).count("1") == bin(circle).count("1"):
+        return cross, circle
+    return circle, cross
+
+
+def lookup(cross: int, circle: int) -> Entry:
+    """
+    returns the solved entry of the given position
+
+    Parameters
+    ----------
+    cross : int
+        the mask of the cells held by the first player
+    circle : int
+        the mask of the cells held by the second player
+
+    Returns
+    -------
+    Entry
+        the winning line, the outcome for the player to move and the cells achieving it
+
+    Raises
+    ------
+    KeyError
+        the position cannot be reached in a legal game
+    """
+    if not _TABLE:
+        _build_table()
+    return _TABLE[_key(cross, circle)]
+
+
+def winning_line(cross: int, circle: int) -> Optional[int]:
+    """returns the mask of the completed line, if any"""
+    return lookup(cross, circle).line
+
+
+def best_move(
+    cross: int,
+    circle: int,
+    *,
+    mistake_rate: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> Optional[int]:
+    """
+    picks the cell for the player to move
+
+    Parameters
+    ----------
+    cross : int
+        the mask of the cells held by the first player
+    circle : int
+        the mask of the cells held by the second player
+    mistake_rate : float, optional
+        the probability of playing a random cell instead of a perfect one, by default 0.0
+    rng : Optional[random.Random], optional
+        the random generator to use, by default None
+
+    Returns
+    -------
+    Optional[int]
+        the cell to play, or None if the game is over
+    """
+    entry = lookup(cross, circle)
+    if not entry.moves:
+        return None
+
+    source = rng or random
+    if mistake_rate and source.random() < mistake_rate:
+        return source.choice([c for c in range(9) if not (cross | circle) & (1 << c)])
+    return source.choice(entry.moves)
+
+
+def cells(mask: int) -> tuple[tuple[int, int], ...]:
+    """returns the (row, col) positions of the cells in the given mask"""
+    return tuple(divmod(c, 3) for c in range(9) if mask & (1 << c))
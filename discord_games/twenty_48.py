@@ -1,24 +1,148 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Final, Literal, Optional
 from io import BytesIO
 import os
 import asyncio
 import random
 import pathlib
-import itertools
+import functools
+import threading
 
 import discord
 from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFont
 
-from .utils import DEFAULT_COLOR, DiscordColor, Player, double_wait, executor
+from .utils import (
+    DEFAULT_COLOR,
+    DiscordColor,
+    Player,
+    executor,
+    run_in_process,
+)
+from .dispatcher import GameDispatcher
+from . import twenty_48_engine as engine
+from . import twenty_48_solver as solver
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
     Board: TypeAlias = list[list[int]]
 
+DIRECTIONS: Final[dict[str, engine.Direction]] = {
+    "⬅️": "left",
+    "➡️": "right",
+    "⬆️": "up",
+    "⬇️": "down",
+}
+HINT_EMOJI: Final[str] = "💡"
+
+FONT_PATH: Final[pathlib.Path] = (
+    pathlib.Path(__file__).parent / "assets/ClearSans-Bold.ttf"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(FONT_PATH), size)
+
+
+class _TileAtlas:
+    """The board background and every tile bitmap, rendered once per style.
+
+    With ``palette`` set, everything is quantized to one shared palette up front,
+    so composed boards are palette images that encode far quicker than RGB ones.
+    """
+
+    def __init__(self, game: Twenty48, *, palette: bool) -> None:
+        self.color_mapping = dict(game._color_mapping)
+        self.light_color = game.LIGHT_CLR
+        self.dark_color = game.DARK_CLR
+        self.bg_color = game.BG_CLR
+        self.border = game.BORDER_W
+        self.square = SQ = game.SQ_S
+        self.space = game.SPACE_W
+        self._lock = threading.Lock()
+
+        length = game.IMG_LENGTH
+        background = Image.new("RGB", (length, length), self.bg_color)
+        empty = self._draw_tile("0")
+        for i in range(16):
+            background.paste(empty, self.position(i // 4, i % 4))
+
+        tiles = {
+            tile: self._draw_tile(tile) for tile in self.color_mapping if tile != "0"
+        }
+
+        if palette:
+            # quantize a single sheet of everything so all the pieces share a palette
+            sheet = Image.new("RGB", (length + (SQ + 1) * len(tiles), length))
+            sheet.paste(background, (0, 0))
+            for i, tile_img in enumerate(tiles.values()):
+                sheet.paste(tile_img, (length + (SQ + 1) * i, 0))
+
+            sheet = sheet.quantize(256)
+            background = sheet.crop((0, 0, length, length))
+            for i, tile in enumerate(tiles):
+                x = length + (SQ + 1) * i
+                tiles[tile] = sheet.crop((x, 0, x + SQ + 1, SQ + 1))
+            self._sheet: Optional[Image.Image] = sheet
+        else:
+            self._sheet = None
+
+        self.background: Image.Image = background
+        self.tiles: dict[str, Image.Image] = tiles
+
+    def position(self, row: int, col: int) -> tuple[int, int]:
+        step = self.square + self.space
+        return self.border + col * step, self.border + row * step
+
+    def _draw_tile(self, tile: str) -> Image.Image:
+        SQ = self.square
+        color, fsize = self.color_mapping.get(tile, (self.bg_color, 50))
+
+        # the tile spans SQ + 1 pixels as PIL rectangles include both end points
+        img = Image.new("RGB", (SQ + 1, SQ + 1), self.bg_color)
+        cursor = ImageDraw.Draw(img)
+        cursor.rounded_rectangle((0, 0, SQ, SQ), radius=5, width=0, fill=color)
+
+        if tile != "0":
+            cursor.text(
+                (SQ / 2, SQ / 2),
+                tile,
+                font=_load_font(fsize),
+                anchor="mm",
+                fill=self.dark_color if tile in ("2", "4") else self.light_color,
+            )
+        return img
+
+    def tile(self, tile: str) -> Image.Image:
+        try:
+            return self.tiles[tile]
+        except KeyError:
+            pass
+
+        # tiles beyond the color mapping are rendered on first use
+        with self._lock:
+            if tile not in self.tiles:
+                img = self._draw_tile(tile)
+                if self._sheet is not None:
+                    img = img.quantize(palette=self._sheet)
+                self.tiles[tile] = img
+            return self.tiles[tile]
+
+    def compose(self, board: Board) -> Image.Image:
+        img = self.background.copy()
+        for r, row in enumerate(board):
+            for c, tile in enumerate(row):
+                if tile:
+                    img.paste(self.tile(str(tile)), self.position(r, c))
+        return img
+
+
+_ATLASES: dict[tuple, _TileAtlas] = {}
+_ATLAS_LOCK: Final[threading.Lock] = threading.Lock()
+
 
 async def create_2048_emojis(
     guild: discord.Guild, names: Optional[list[str]] = None
@@ -70,16 +194,19 @@ class Twenty48:
         number_to_display_mapping: dict[str, str] = {},
         *,
         render_image: bool = False,
+        fast_encode: bool = False,
     ) -> None:
         self.embed_color: Optional[DiscordColor] = None
         self.embed: Optional[discord.Embed] = None
 
-        self.board: Board = [[0 for _ in range(4)] for _ in range(4)]
+        self.state: int = 0
+        self.score: int = 0
         self.message: Optional[discord.Message] = None
 
         self._controls = ["⬅️", "➡️", "⬆️", "⬇️"]
         self._conversion = number_to_display_mapping
         self._render_image = render_image
+        self._fast_encode = fast_encode
 
         if self._render_image:
             self._color_mapping: dict[str, tuple[tuple[int, int, int], int]] = {
@@ -109,66 +236,108 @@ class Twenty48:
 
             self.IMG_LENGTH = self.BORDER_W * 2 + self.SQ_S * 4 + self.SPACE_W * 3
 
-            self._font = ImageFont.truetype(
-                str(pathlib.Path(__file__).parent / "assets/ClearSans-Bold.ttf"), 50
-            )
+            self._font = _load_font(50)
+
+    @property
+    def board(self) -> Board:
+        """the board as a 4x4 grid of tile values, built from :attr:`state`"""
+        return engine.unpack(self.state)
 
-    def _reverse(self, board: Board) -> Board:
-        return [row[::-1] for row in board]
-
-    def _transp(self, board: Board) -> Board:
-        return [[board[i][j] for i in range(4)] for j in range(4)]
-
-    def _merge(self, board: Board) -> Board:
-        for i in range(4):
-            for j in range(3):
-                tile = board[i][j]
-                if tile == board[i][j + 1] and tile != 0:
-                    board[i][j] *= 2
-                    board[i][j + 1] = 0
-        return board
-
-    def _compress(self, board: Board) -> Board:
-        new_board = [[0 for _ in range(4)] for _ in range(4)]
-        for i in range(4):
-            pos = 0
-            for j in range(4):
-                if board[i][j] != 0:
-                    new_board[i][pos] = board[i][j]
-                    pos += 1
-        return new_board
+    @board.setter
+    def board(self, board: Board) -> None:
+        self.state = engine.pack(board)
+
+    def move(self, direction: engine.Direction) -> bool:
+        """
+        slides the board in the given direction
+
+        Parameters
+        ----------
+        direction : Literal["left", "right", "up", "down"]
+            the direction to slide in
+
+        Returns
+        -------
+        bool
+            returns whether or not the move changed the board
+        """
+        self.state, changed, score = engine.slide(self.state, direction)
+        self.score += score
+        return changed
 
     def move_left(self) -> None:
-        stage = self._compress(self.board)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        self.board = stage
+        self.move("left")
 
     def move_right(self) -> None:
-        stage = self._reverse(self.board)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._reverse(stage)
-        self.board = stage
+        self.move("right")
 
     def move_up(self) -> None:
-        stage = self._transp(self.board)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._transp(stage)
-        self.board = stage
+        self.move("up")
 
     def move_down(self) -> None:
-        stage = self._transp(self.board)
-        stage = self._reverse(stage)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._reverse(stage)
-        stage = self._transp(stage)
-        self.board = stage
+        self.move("down")
+
+    def has_moves(self) -> bool:
+        return engine.has_moves(self.state)
+
+    async def get_hint(
+        self, *, time_budget: Optional[float] = 0.5
+    ) -> Optional[engine.Direction]:
+        """
+        searches for the best move in a worker process,
+        the shared pool of which is closed by :func:`discord_games.utils.shutdown_process_pool`
+
+        Parameters
+        ----------
+        time_budget : Optional[float], optional
+            the number of seconds to search for, by default 0.5
+
+        Returns
+        -------
+        Optional[Literal["left", "right", "up", "down"]]
+            the suggested move, or None if there are no moves left
+        """
+        return await run_in_process(
+            solver.best_move, self.state, time_budget=time_budget
+        )
+
+    def hint_message(self, direction: Optional[engine.Direction]) -> str:
+        if direction is None:
+            return "There are no moves left!"
+
+        emoji = next(e for e, d in DIRECTIONS.items() if d == direction)
+        return f"{HINT_EMOJI} Hint: try moving **{direction}** {emoji}"
+
+    async def autoplay(
+        self,
+        *,
+        max_moves: Optional[int] = None,
+        time_budget: Optional[float] = 0.05,
+    ) -> int:
+        """
+        plays the game headlessly in a worker process, meant for demos,
+        the shared pool of which is closed by :func:`discord_games.utils.shutdown_process_pool`
+
+        Parameters
+        ----------
+        max_moves : Optional[int], optional
+            the maximum number of moves to make, by default None
+        time_budget : Optional[float], optional
+            the search time for every move, by default 0.05
+
+        Returns
+        -------
+        int
+            returns the number of moves made
+        """
+        self.state, score, moves = await run_in_process(
+            solver.autoplay,
+            self.state,
+            max_moves=max_moves,
+            time_budget=time_budget,
+        )
+        self.score += score
+        return moves
 
     def spawn_new(self) -> bool:
         """
@@ -179,17 +348,18 @@ class Twenty48:
         bool
             returns whether or not the game is lost
         """
-        board = self.board
-        zeroes = [
-            (j, i) for j, sub in enumerate(board) for i, el in enumerate(sub) if el == 0
-        ]
-
-        if not zeroes:
-            return True
-        else:
+        if zeroes := engine.empty_cells(self.state):
             i, j = random.choice(zeroes)
-            board[i][j] = 2
-            return False
+            self.state = engine.set_tile(self.state, i, j, 1)
+
+        return not engine.has_moves(self.state)
+
+    def spawn_initial(self) -> None:
+        """places the two starting `2`s"""
+        for _ in range(2):
+            self.state = engine.set_tile(
+                self.state, random.randrange(4), random.randrange(4), 1
+            )
 
     def number_to_emoji(self) -> str:
         board = self.board
@@ -205,10 +375,10 @@ class Twenty48:
         return game_string
 
     def check_win(self) -> bool:
-        flattened = itertools.chain(*self.board)
+        tiles = {tile for row in self.board for tile in row}
 
         for num in (2048, 4096, 8192):
-            if num in flattened:
+            if num in tiles:
                 if num == 2048:
                     self.embed = discord.Embed(description="", color=self.embed_color)
                 if self.embed is not None:
@@ -221,39 +391,35 @@ class Twenty48:
                         return True
         return False
 
+    def _get_atlas(self) -> _TileAtlas:
+        key = (
+            tuple(self._color_mapping.items()),
+            self.LIGHT_CLR,
+            self.DARK_CLR,
+            self.BG_CLR,
+            self.BORDER_W,
+            self.SQ_S,
+            self.SPACE_W,
+            self._fast_encode,
+        )
+        try:
+            return _ATLASES[key]
+        except KeyError:
+            pass
+
+        with _ATLAS_LOCK:
+            if key not in _ATLASES:
+                _ATLASES[key] = _TileAtlas(self, palette=self._fast_encode)
+            return _ATLASES[key]
+
     @executor()
     def render_image(self) -> discord.File:
-        SQ = self.SQ_S
-        with Image.new("RGB", (self.IMG_LENGTH, self.IMG_LENGTH), self.BG_CLR) as img:
-            cursor = ImageDraw.Draw(img)
-
-            x = y = self.BORDER_W
-            for row in self.board:
-                for tile in row:
-                    tile = str(tile)
-                    color, fsize = self._color_mapping.get(tile, (self.BG_CLR, 50))
-                    font = self._font.font_variant(size=fsize)
-                    cursor.rounded_rectangle(
-                        (x, y, x + SQ, y + SQ), radius=5, width=0, fill=color
-                    )
-
-                    if tile != "0":
-                        text_fill = (
-                            self.DARK_CLR if tile in ("2", "4") else self.LIGHT_CLR
-                        )
-                        cursor.text(
-                            (x + SQ / 2, y + SQ / 2),
-                            tile,
-                            font=font,
-                            anchor="mm",
-                            fill=text_fill,
-                        )
-
-                    x += SQ + self.SPACE_W
-                x = self.BORDER_W
-                y += SQ + self.SPACE_W
-
-            buf = BytesIO()
+        img = self._get_atlas().compose(self.board)
+
+        buf = BytesIO()
+        if self._fast_encode:
+            img.save(buf, "PNG", compress_level=1)
+        else:
             img.save(buf, "PNG")
         buf.seek(0)
         return discord.File(buf, "2048.png")
@@ -266,6 +432,8 @@ class Twenty48:
         timeout: Optional[float] = None,
         remove_reaction_after: bool = False,
         delete_button: bool = False,
+        hint_button: bool = False,
+        hint_time: Optional[float] = 0.5,
         embed_color: DiscordColor = DEFAULT_COLOR,
         **kwargs,
     ) -> discord.Message:
@@ -284,6 +452,10 @@ class Twenty48:
             specifies whether or not to remove the move reaction, by default False
         delete_button : bool, optional
             specifies whether or not to include a stop button or not, by default False
+        hint_button : bool, optional
+            specifies whether or not to include a button that suggests a move, by default False
+        hint_time : Optional[float], optional
+            the number of seconds to search for a hint, by default 0.5
         embed_color : DiscordColor, optional
             the color of the game embed, by default DEFAULT_COLOR
 
@@ -296,8 +468,7 @@ class Twenty48:
         self.embed_color = embed_color
         self.player = ctx.author
 
-        self.board[random.randrange(4)][random.randrange(4)] = 2
-        self.board[random.randrange(4)][random.randrange(4)] = 2
+        self.spawn_initial()
 
         if self._render_image:
             image = await self.render_image()
@@ -306,6 +477,9 @@ class Twenty48:
             board_string = self.number_to_emoji()
             self.message = await ctx.send(board_string, **kwargs)
 
+        if hint_button:
+            self._controls.append(HINT_EMOJI)
+
         if delete_button:
             self._controls.append("⏹️")
 
@@ -323,11 +497,13 @@ class Twenty48:
                 )
 
             try:
-                done, _ = await double_wait(
-                    ctx.bot.wait_for("reaction_add", timeout=timeout, check=check),
-                    ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check),
+                reaction, user = await GameDispatcher.get(ctx.bot).wait_for_reaction(
+                    message=self.message.id,
+                    user=self.player.id,
+                    check=check,
+                    timeout=timeout,
+                    remove=True,
                 )
-                reaction, user = done.pop().result()
             except asyncio.TimeoutError:
                 break
 
@@ -337,24 +513,25 @@ class Twenty48:
                 await self.message.delete()
                 break
 
-            if emoji == "➡️":
-                self.move_right()
-
-            elif emoji == "⬅️":
-                self.move_left()
-
-            elif emoji == "⬇️":
-                self.move_down()
-
-            elif emoji == "⬆️":
-                self.move_up()
-
             if remove_reaction_after:
                 try:
                     await self.message.remove_reaction(emoji, user)
                 except discord.DiscordException:
                     pass
 
+            if emoji == HINT_EMOJI:
+                hint = await self.get_hint(time_budget=hint_time)
+                await self.message.reply(
+                    self.hint_message(hint), delete_after=10, mention_author=False
+                )
+                continue
+
+            changed = self.move(DIRECTIONS[emoji])
+
+            # nothing moved, so there is no new tile and nothing to re-render
+            if not changed:
+                continue
+
             lost = self.spawn_new()
             won = self.check_win()
 
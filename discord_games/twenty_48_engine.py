@@ -0,0 +1,243 @@
+"""A bitboard engine for 2048.
+
+The board is packed into a single 64-bit integer, 4 bits per cell,
+each cell holding the exponent of its tile (0 being empty, 1 being 2, 2 being 4 ...).
+Row ``r`` occupies bits ``16 * r`` to ``16 * r + 15`` and column ``c``
+of a row occupies bits ``4 * c`` to ``4 * c + 3`` of it.
+
+Sliding a row is a lookup into one of two precomputed 65536-entry tables,
+moving up and down works on the transposed board.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Final, Literal, TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+    Board: TypeAlias = list[list[int]]
+
+Direction = Literal["left", "right", "up", "down"]
+
+__all__: tuple[str, ...] = (
+    "MAX_EXPONENT",
+    "pack",
+    "unpack",
+    "transpose",
+    "move_left",
+    "move_right",
+    "move_up",
+    "move_down",
+    "slide",
+    "has_moves",
+    "get_tile",
+    "set_tile",
+    "empty_cells",
+)
+
+ROW_MASK: Final[int] = 0xFFFF
+MAX_EXPONENT: Final[int] = 15
+
+ONES: Final[int] = 0x1111_1111_1111_1111
+HIGHS: Final[int] = 0x8888_8888_8888_8888
+LAST_COL: Final[int] = 0xF000_F000_F000_F000
+
+_ROW_LEFT: array[int] = array("H")
+_ROW_RIGHT: array[int] = array("H")
+_SCORE_LEFT: array[int] = array("I")
+_SCORE_RIGHT: array[int] = array("I")
+_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _slide_row(cells: list[int]) -> tuple[list[int], int]:
+    tiles = [cell for cell in cells if cell]
+    result: list[int] = []
+    score = 0
+
+    i = 0
+    while i < len(tiles):
+        if i + 1 < len(tiles) and tiles[i] == tiles[i + 1]:
+            merged = min(tiles[i] + 1, MAX_EXPONENT)
+            result.append(merged)
+            score += 1 << merged
+            i += 2
+        else:
+            result.append(tiles[i])
+            i += 1
+    return result + [0] * (4 - len(result)), score
+
+
+def _build_tables() -> None:
+    with _LOCK:
+        if _ROW_LEFT:
+            return
+
+        left = array("H", bytes(2 * 65536))
+        right = array("H", bytes(2 * 65536))
+        left_score = array("I", bytes(4 * 65536))
+        right_score = array("I", bytes(4 * 65536))
+
+        for row in range(65536):
+            cells = [(row >> (4 * c)) & 0xF for c in range(4)]
+
+            slid, left_score[row] = _slide_row(cells)
+            left[row] = slid[0] | slid[1] << 4 | slid[2] << 8 | slid[3] << 12
+
+            slid, right_score[row] = _slide_row(cells[::-1])
+            right[row] = slid[3] | slid[2] << 4 | slid[1] << 8 | slid[0] << 12
+
+        _SCORE_LEFT.extend(left_score)
+        _SCORE_RIGHT.extend(right_score)
+        _ROW_RIGHT.extend(right)
+        # filled last, as its emptiness marks the tables as unbuilt
+        _ROW_LEFT.extend(left)
+
+
+def _move_rows(state: int, table: array[int]) -> int:
+    if not table:
+        _build_tables()
+    return (
+        table[state & ROW_MASK]
+        | table[(state >> 16) & ROW_MASK] << 16
+        | table[(state >> 32) & ROW_MASK] << 32
+        | table[(state >> 48) & ROW_MASK] << 48
+    )
+
+
+def pack(board: Board) -> int:
+    """packs a 4x4 board of tile values into a bitboard"""
+    state = 0
+    for r, row in enumerate(board):
+        for c, tile in enumerate(row):
+            if tile:
+                exponent = tile.bit_length() - 1
+                if tile != 1 << exponent or not 0 < exponent <= MAX_EXPONENT:
+                    raise ValueError(f"{tile} is not a valid 2048 tile")
+                state |= exponent << (16 * r + 4 * c)
+    return state
+
+
+def unpack(state: int) -> Board:
+    """unpacks a bitboard into a 4x4 board of tile values"""
+    board: Board = []
+    for r in range(4):
+        row = []
+        for c in range(4):
+            exponent = (state >> (16 * r + 4 * c)) & 0xF
+            row.append(1 << exponent if exponent else 0)
+        board.append(row)
+    return board
+
+
+def transpose(state: int) -> int:
+    """swaps the rows and columns of a bitboard"""
+    # swap the 4-bit cells across the diagonal of each 2x2 block, then the 2x2 blocks themselves
+    a = (
+        state & 0xF0F0_0F0F_F0F0_0F0F
+        | (state & 0x0000_F0F0_0000_F0F0) << 12
+        | (state & 0x0F0F_0000_0F0F_0000) >> 12
+    )
+    return (
+        a & 0xFF00_FF00_00FF_00FF
+        | (a & 0x00FF_00FF_0000_0000) >> 24
+        | (a & 0x0000_0000_FF00_FF00) << 24
+    )
+
+
+def move_left(state: int) -> int:
+    return _move_rows(state, _ROW_LEFT)
+
+
+def move_right(state: int) -> int:
+    return _move_rows(state, _ROW_RIGHT)
+
+
+def move_up(state: int) -> int:
+    return transpose(_move_rows(transpose(state), _ROW_LEFT))
+
+
+def move_down(state: int) -> int:
+    return transpose(_move_rows(transpose(state), _ROW_RIGHT))
+
+
+def _score_rows(state: int, table: array[int]) -> int:
+    return (
+        table[state & ROW_MASK]
+        + table[(state >> 16) & ROW_MASK]
+        + table[(state >> 32) & ROW_MASK]
+        + table[(state >> 48) & ROW_MASK]
+    )
+
+
+def slide(state: int, direction: Direction) -> tuple[int, bool, int]:
+    """
+    slides the board in the given direction
+
+    Parameters
+    ----------
+    state : int
+        the bitboard to slide
+    direction : Literal["left", "right", "up", "down"]
+        the direction to slide in
+
+    Returns
+    -------
+    tuple[int, bool, int]
+        the new bitboard, whether or not it differs from the old one
+        and the sum of the tiles created by merges
+    """
+    if not _ROW_LEFT:
+        _build_tables()
+
+    if direction == "left":
+        new = _move_rows(state, _ROW_LEFT)
+        score = _score_rows(state, _SCORE_LEFT)
+    elif direction == "right":
+        new = _move_rows(state, _ROW_RIGHT)
+        score = _score_rows(state, _SCORE_RIGHT)
+    else:
+        transposed = transpose(state)
+        if direction == "up":
+            new = transpose(_move_rows(transposed, _ROW_LEFT))
+            score = _score_rows(transposed, _SCORE_LEFT)
+        elif direction == "down":
+            new = transpose(_move_rows(transposed, _ROW_RIGHT))
+            score = _score_rows(transposed, _SCORE_RIGHT)
+        else:
+            raise ValueError(f"{direction!r} is not a valid direction")
+    return new, new != state, score
+
+
+def _has_zero_nibble(value: int) -> bool:
+    return ((value - ONES) & ~value & HIGHS) != 0
+
+
+def has_moves(state: int) -> bool:
+    """returns whether or not any move would change the board"""
+    if _has_zero_nibble(state):
+        return True
+
+    # equal neighbours xor to a zero nibble, the last column has no right neighbour
+    for board in (state, transpose(state)):
+        if _has_zero_nibble((board ^ (board >> 4)) | LAST_COL):
+            return True
+    return False
+
+
+def get_tile(state: int, row: int, col: int) -> int:
+    """returns the exponent of the tile at the given position"""
+    return (state >> (16 * row + 4 * col)) & 0xF
+
+
+def set_tile(state: int, row: int, col: int, exponent: int) -> int:
+    """returns the bitboard with the tile at the given position set to the exponent"""
+    shift = 16 * row + 4 * col
+    return (state & ~(0xF << shift)) | (exponent & 0xF) << shift
+
+
+def empty_cells(state: int) -> list[tuple[int, int]]:
+    """returns the (row, col) positions of every empty cell"""
+    return [(i // 4, i % 4) for i in range(16) if not (state >> (4 * i)) & 0xF]
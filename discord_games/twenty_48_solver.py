@@ -0,0 +1,246 @@
+"""An expectimax solver for 2048, built on :mod:`twenty_48_engine`.
+
+The functions here are CPU-bound and meant to be ran through
+:func:`discord_games.utils.run_in_process` rather than on the event loop.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Final, Optional
+import random
+import threading
+import time
+
+from . import twenty_48_engine as engine
+
+__all__: tuple[str, ...] = (
+    "best_move",
+    "autoplay",
+)
+
+DIRECTIONS: Final[tuple[engine.Direction, ...]] = ("up", "left", "right", "down")
+
+# probability below which a branch is no longer expanded
+PROB_CUTOFF: Final[float] = 1e-4
+
+LOST_PENALTY: Final[float] = 200_000.0
+MONOTONICITY_POWER: Final[float] = 4.0
+MONOTONICITY_WEIGHT: Final[float] = 47.0
+SUM_POWER: Final[float] = 3.5
+SUM_WEIGHT: Final[float] = 11.0
+MERGES_WEIGHT: Final[float] = 700.0
+EMPTY_WEIGHT: Final[float] = 270.0
+
+_ROW_HEURISTIC: array[float] = array("d")
+_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _score_row(cells: list[int]) -> float:
+    total = sum(cell**SUM_POWER for cell in cells)
+    empty = cells.count(0)
+
+    merges = 0
+    prev = 0
+    counter = 0
+    for cell in cells:
+        if not cell:
+            continue
+        if prev == cell:
+            counter += 1
+        elif counter > 0:
+            merges += 1 + counter
+            counter = 0
+        prev = cell
+    if counter > 0:
+        merges += 1 + counter
+
+    mono_left = mono_right = 0.0
+    for a, b in zip(cells, cells[1:]):
+        if a > b:
+            mono_left += a**MONOTONICITY_POWER - b**MONOTONICITY_POWER
+        else:
+            mono_right += b**MONOTONICITY_POWER - a**MONOTONICITY_POWER
+
+    return (
+        LOST_PENALTY
+        + EMPTY_WEIGHT * empty
+        + MERGES_WEIGHT * merges
+        - MONOTONICITY_WEIGHT * min(mono_left, mono_right)
+        - SUM_WEIGHT * total
+    )
+
+
+def _build_heuristic() -> None:
+    with _LOCK:
+        if _ROW_HEURISTIC:
+            return
+        _ROW_HEURISTIC.extend(
+            _score_row([(row >> (4 * c)) & 0xF for c in range(4)])
+            for row in range(65536)
+        )
+
+
+def _heuristic(state: int) -> float:
+    table = _ROW_HEURISTIC
+    transposed = engine.transpose(state)
+    return (
+        table[state & 0xFFFF]
+        + table[(state >> 16) & 0xFFFF]
+        + table[(state >> 32) & 0xFFFF]
+        + table[(state >> 48) & 0xFFFF]
+        + table[transposed & 0xFFFF]
+        + table[(transposed >> 16) & 0xFFFF]
+        + table[(transposed >> 32) & 0xFFFF]
+        + table[(transposed >> 48) & 0xFFFF]
+    )
+
+
+class _Search:
+    __slots__ = ("deadline", "cache", "nodes")
+
+    def __init__(self, deadline: Optional[float]) -> None:
+        self.deadline = deadline
+        # state -> (depth searched, value)
+        self.cache: dict[int, tuple[int, float]] = {}
+        self.nodes: int = 0
+
+    def max_node(self, state: int, depth: int, prob: float) -> float:
+        best = 0.0
+        for direction in DIRECTIONS:
+            new, changed, _ = engine.slide(state, direction)
+            if changed:
+                best = max(best, self.chance_node(new, depth, prob))
+        return best
+
+    def chance_node(self, state: int, depth: int, prob: float) -> float:
+        if depth <= 0 or prob < PROB_CUTOFF:
+            return _heuristic(state)
+
+        cached = self.cache.get(state)
+        if cached is not None and cached[0] >= depth:
+            return cached[1]
+
+        self.nodes += 1
+        if (
+            self.deadline is not None
+            and not self.nodes & 0xFF
+            and time.perf_counter() > self.deadline
+        ):
+            raise _Timeout
+
+        # the games only ever spawn `2`s, so each empty cell is equally likely
+        empty = engine.empty_cells(state)
+        prob /= len(empty)
+        value = sum(
+            self.max_node(engine.set_tile(state, r, c, 1), depth - 1, prob)
+            for r, c in empty
+        ) / len(empty)
+
+        self.cache[state] = (depth, value)
+        return value
+
+
+def best_move(
+    state: int,
+    *,
+    max_depth: int = 3,
+    time_budget: Optional[float] = 0.5,
+) -> Optional[engine.Direction]:
+    """
+    searches for the best move using depth-limited expectimax with iterative deepening
+
+    Parameters
+    ----------
+    state : int
+        the bitboard to search from
+    max_depth : int, optional
+        the maximum number of moves to look ahead, by default 3
+    time_budget : Optional[float], optional
+        the number of seconds to search for, a search of depth 1 always completes, by default 0.5
+
+    Returns
+    -------
+    Optional[Literal["left", "right", "up", "down"]]
+        the best move found, or None if there are no legal moves
+    """
+    if not _ROW_HEURISTIC:
+        _build_heuristic()
+
+    moves = [
+        (direction, new)
+        for direction in DIRECTIONS
+        for new, changed, _ in (engine.slide(state, direction),)
+        if changed
+    ]
+    if not moves:
+        return None
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    best: engine.Direction = moves[0][0]
+
+    for depth in range(1, max_depth + 1):
+        search = _Search(deadline if depth > 1 else None)
+        try:
+            scores = [(search.chance_node(new, depth, 1.0), d) for d, new in moves]
+        except _Timeout:
+            break
+        best = max(scores, key=lambda s: s[0])[1]
+    return best
+
+
+def autoplay(
+    state: int = 0,
+    *,
+    max_moves: Optional[int] = None,
+    max_depth: int = 2,
+    time_budget: Optional[float] = 0.05,
+    seed: Optional[int] = None,
+) -> tuple[int, int, int]:
+    """
+    plays a game headlessly using :func:`best_move` until no moves are left
+
+    Parameters
+    ----------
+    state : int, optional
+        the bitboard to start from, an empty board gets two starting `2`s, by default 0
+    max_moves : Optional[int], optional
+        the maximum number of moves to make, by default None
+    max_depth : int, optional
+        the search depth for every move, by default 2
+    time_budget : Optional[float], optional
+        the search time for every move, by default 0.05
+    seed : Optional[int], optional
+        the seed for spawning new tiles, by default None
+
+    Returns
+    -------
+    tuple[int, int, int]
+        the final bitboard, the score gained and the number of moves made
+    """
+    rng = random.Random(seed)
+
+    def spawn(state: int) -> int:
+        if empty := engine.empty_cells(state):
+            r, c = rng.choice(empty)
+            state = engine.set_tile(state, r, c, 1)
+        return state
+
+    if not state:
+        state = spawn(spawn(state))
+
+    score = moves = 0
+    while max_moves is None or moves < max_moves:
+        direction = best_move(state, max_depth=max_depth, time_budget=time_budget)
+        if direction is None:
+            break
+
+        state, _, gained = engine.slide(state, direction)
+        state = spawn(state)
+        score += gained
+        moves += 1
+    return state, score, moves
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, ClassVar, TypedDict, TYPE_CHECKING
+from typing import Final, Literal, Optional, ClassVar, TypedDict, TYPE_CHECKING
 from io import BytesIO
 
 import textwrap
+import functools
 import time
-import random
 import asyncio
-import aiohttp
 import difflib
 import pathlib
 
@@ -16,14 +15,13 @@ import discord
 from discord.ext import commands
 
 from .utils import DEFAULT_COLOR, DiscordColor, executor
+from .dispatcher import GameDispatcher
+from .lexicon import get_lexicon
+from .quotes import DEFAULT_URL, get_quote_buffer
 
 
 if TYPE_CHECKING:
 
-    class QuoteAPIResponse(TypedDict):
-        quote: str
-        id: int
-
     class UserData(TypedDict):
         user: discord.User
         time: float
@@ -31,13 +29,77 @@ if TYPE_CHECKING:
         acc: float
 
 
+TEXT_SIZE: Final[int] = 30
+
+
+@functools.lru_cache(maxsize=16)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _measuring_cursor() -> ImageDraw.ImageDraw:
+    return ImageDraw.Draw(Image.new("RGB", (0, 0)))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_card(text: str, font_path: str) -> bytes:
+    # the encoded png is cached, so a recurring prompt skips rendering and encoding altogether
+    text = "\n".join(textwrap.wrap(text, width=25))
+    font = _load_font(font_path, TEXT_SIZE)
+
+    try:
+        x, y = font.getsize_multiline(text)  # type: ignore[attr-defined]
+    except AttributeError:
+        _, _, x, y = _measuring_cursor().multiline_textbbox((10, 10), text, font=font)
+
+    with Image.new("RGB", (int(x) + 20, int(y) + 30), (0, 0, 30)) as image:
+        cursor = ImageDraw.Draw(image)
+        cursor.multiline_text((10, 10), text, font=font, fill=(220, 200, 220))
+
+        buffer = BytesIO()
+        image.save(buffer, "PNG")
+        return buffer.getvalue()
+
+
+class _AccuracyMatcher:
+    """Scores attempts against a single target text.
+
+    The target is handed to the :class:`difflib.SequenceMatcher` once,
+    so its index is built once per race. Attempts are first gated on the matcher's
+    length and character-count upper bounds, which are linear,
+    so only plausible attempts pay for the full ratio.
+    """
+
+    __slots__ = ("min_accuracy", "_matcher")
+
+    def __init__(self, text: str, min_accuracy: float) -> None:
+        self.min_accuracy = min_accuracy
+        self._matcher = difflib.SequenceMatcher(None)
+        self._matcher.set_seq2(text)
+
+    def score(self, attempt: str) -> Optional[float]:
+        """returns the similarity of the attempt to the text, or None if it is below the minimum"""
+        matcher = self._matcher
+        matcher.set_seq1(attempt)
+
+        if (
+            matcher.real_quick_ratio() < self.min_accuracy
+            or matcher.quick_ratio() < self.min_accuracy
+        ):
+            return None
+
+        ratio = matcher.ratio()
+        return ratio if ratio >= self.min_accuracy else None
+
+
 class TypeRacer:
     """Type racing game, message-based.
 
     Players race to type a sentence. Measures WPM and accuracy.
     """
 
-    SENTENCE_URL: ClassVar[str] = "https://dummyjson.com/quotes/random"
+    SENTENCE_URL: ClassVar[str] = DEFAULT_URL
     EMOJI_MAP: ClassVar[dict[int, str]] = {
         1: "🥇",
         2: "🥈",
@@ -46,26 +108,7 @@ class TypeRacer:
 
     @executor()
     def _tr_img(self, text: str, font_path: str) -> BytesIO:
-        text = "\n".join(textwrap.wrap(text, width=25))
-
-        font = ImageFont.truetype(font_path, 30)
-        try:
-            x, y = font.getsize_multiline(text)  # type: ignore[attr-defined]
-        except AttributeError:
-            _, _, x, y = ImageDraw.Draw(Image.new("RGB", (0, 0))).multiline_textbbox(
-                (10, 10),
-                text,
-                font=font,
-            )
-
-        with Image.new("RGB", (int(x) + 20, int(y) + 30), (0, 0, 30)) as image:
-            cursor = ImageDraw.Draw(image)
-            cursor.multiline_text((10, 10), text, font=font, fill=(220, 200, 220))
-
-            buffer = BytesIO()
-            image.save(buffer, "PNG")
-            buffer.seek(0)
-            return buffer
+        return BytesIO(_render_card(text, font_path))
 
     def format_line(self, i: int, data: UserData) -> str:
         return f" • {self.EMOJI_MAP[i]} | {data['user'].mention} in {data['time']:.2f}s | **WPM:** {data['wpm']:.2f} | **ACC:** {data['acc']:.2f}%"
@@ -80,25 +123,31 @@ class TypeRacer:
     ) -> discord.Message:
         self.embed.description = ""
 
-        winners = []
+        winners: list[UserData] = []
+        winner_ids: set[int] = set()
+        accuracies: dict[int, float] = {}
+        matcher = _AccuracyMatcher(text, min_accuracy)
         start = time.perf_counter()
 
-        while not ctx.bot.is_closed():
+        def check(m: discord.Message) -> bool:
+            if m.author.bot or m.author.id in winner_ids:
+                return False
 
-            def check(m: discord.Message) -> bool:
-                content = m.content.replace("\n", " ").strip()
-                if (
-                    m.channel == ctx.channel
-                    and not m.author.bot
-                    and m.author not in map(lambda m: m["user"], winners)
-                ):
-                    sim = difflib.SequenceMatcher(None, content, text).ratio()
-                    return sim >= min_accuracy
+            accuracy = matcher.score(m.content.replace("\n", " ").strip())
+            if accuracy is None:
                 return False
 
+            accuracies[m.id] = accuracy
+            return True
+
+        while not ctx.bot.is_closed():
             try:
-                message: discord.Message = await ctx.bot.wait_for(
-                    "message", timeout=timeout, check=check
+                message: discord.Message = await GameDispatcher.get(
+                    ctx.bot
+                ).wait_for_message(
+                    channel=ctx.channel.id,
+                    check=check,
+                    timeout=timeout,
                 )
             except asyncio.TimeoutError:
                 if winners:
@@ -110,15 +159,15 @@ class TypeRacer:
                     )
 
             end = time.perf_counter()
-            content = message.content.replace("\n", " ").strip()
             timeout -= round(end - start)
 
+            winner_ids.add(message.author.id)
             winners.append(
                 {
                     "user": message.author,
                     "time": end - start,
                     "wpm": len(text.split()) / ((end - start) / 60),
-                    "acc": difflib.SequenceMatcher(None, content, text).ratio() * 100,
+                    "acc": accuracies.pop(message.id) * 100,
                 }
             )
 
@@ -153,6 +202,7 @@ class TypeRacer:
         path_to_text_font: Optional[str] = None,
         timeout: float = 40,
         words_mode: bool = False,
+        words_difficulty: Optional[Literal["easy", "medium", "hard"]] = None,
         show_author: bool = True,
         max_quote_length: Optional[int] = None,
         min_accuracy: float = 0.9,
@@ -175,6 +225,8 @@ class TypeRacer:
             the game timeout, by default 40
         words_mode : bool, optional
             specifies whether or not to just use random words instead of a quote, by default False
+        words_difficulty : Optional[Literal["easy", "medium", "hard"]], optional
+            the difficulty tier to draw the words from in words mode, by default None
         show_author : bool, optional
             specifies whether or not to show the command author in the embed, by default True
         max_quote_length : int, optional
@@ -186,30 +238,17 @@ class TypeRacer:
         -------
         discord.Message
             the game message
-
-        Raises
-        ------
-        RuntimeError
-            requesting the quote failed
         """
         self.embed_color = embed_color
         parent = pathlib.Path(__file__).parent
 
         if not words_mode:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.SENTENCE_URL) as r:
-                    if r.ok:
-                        data: QuoteAPIResponse = await r.json()
-                        text = data.get("quote", "").replace("\n", " ").strip()
-                    else:
-                        raise RuntimeError(
-                            f"HTTP request raised an error: {r.status}; {r.reason}"
-                        )
+            text = await get_quote_buffer(self.SENTENCE_URL).get()
 
         else:
-            with open(parent / "assets/words.txt", "r") as wordsfp:
-                words = wordsfp.read().splitlines()
-                text = " ".join(random.choice(words).lower() for _ in range(8))
+            text = " ".join(
+                get_lexicon("wordle").sample(8, difficulty=words_difficulty)
+            )
 
         if max_quote_length is not None:
             if len(text) > max_quote_length:
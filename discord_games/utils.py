@@ -11,12 +11,15 @@ from typing import (
     Any,
 )
 
+from concurrent.futures import Executor, ProcessPoolExecutor
 import functools
 import asyncio
 
 import discord
 from discord.ext import commands
 
+from .dispatcher import GameDispatcher
+
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec, TypeAlias
 
@@ -31,6 +34,9 @@ __all__: tuple[str, ...] = (
     "Player",
     "DEFAULT_COLOR",
     "executor",
+    "run_in_process",
+    "set_process_pool",
+    "shutdown_process_pool",
     "chunk",
     "BaseView",
     "double_wait",
@@ -60,6 +66,56 @@ def executor() -> Callable[[Callable[P, T]], Callable[P, asyncio.Future[T]]]:
     return decorator
 
 
+_process_pool: Optional[Executor] = None
+
+
+def set_process_pool(pool: Optional[Executor]) -> None:
+    """
+    sets the executor used by :func:`run_in_process`,
+    passing None makes it lazily create its own process pool again
+
+    Parameters
+    ----------
+    pool : Optional[Executor]
+        the executor to run CPU-bound work such as game solvers in
+    """
+    global _process_pool
+    _process_pool = pool
+
+
+def shutdown_process_pool(*, wait: bool = True) -> None:
+    """
+    shuts down the executor used by :func:`run_in_process`, meant to be called on shutdown,
+    a new process pool is lazily created if it is used again afterwards
+
+    Parameters
+    ----------
+    wait : bool, optional
+        specifies whether or not to wait for the running work and the worker processes to finish, by default True
+    """
+    global _process_pool
+    pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def run_in_process(
+    func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> asyncio.Future[T]:
+    """
+    runs a module level function in a shared worker process,
+    keeping CPU-bound work such as game solvers off of the event loop,
+    the workers live until :func:`shutdown_process_pool` is called
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor()
+
+    partial = functools.partial(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_process_pool, partial)
+
+
 async def wait_for_delete(
     ctx: commands.Context[commands.Bot],
     message: discord.Message,
@@ -88,7 +144,12 @@ async def wait_for_delete(
 
     resolved_bot: discord.Client = bot or ctx.bot
     try:
-        await resolved_bot.wait_for("reaction_add", timeout=timeout, check=check)
+        await GameDispatcher.get(resolved_bot).wait_for_reaction(
+            message=message.id,
+            user=None if isinstance(user, tuple) else user.id,
+            check=check,
+            timeout=timeout,
+        )
     except asyncio.TimeoutError:
         return False
     else:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import pathlib
-import random
 import asyncio
-from typing import Optional, Final
+import functools
+from typing import Optional, Final, Iterable, Union
 from io import BytesIO
 
 import discord
@@ -11,6 +11,8 @@ from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFont
 
 from .utils import DEFAULT_COLOR, DiscordColor, executor
+from .dispatcher import GameDispatcher
+from .lexicon import WordValidator, get_lexicon
 
 BORDER: Final[int] = 40
 SQ: Final[int] = 100
@@ -24,6 +26,44 @@ ORANGE: Final[tuple[int, int, int]] = (200, 179, 87)
 GREEN: Final[tuple[int, int, int]] = (105, 169, 99)
 LGRAY: Final[tuple[int, int, int]] = (198, 201, 205)
 
+FONT_PATH: Final[pathlib.Path] = (
+    pathlib.Path(__file__).parent / "assets/HelveticaNeuBold.ttf"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font(text_size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(FONT_PATH), text_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _blank_board() -> Image.Image:
+    img = Image.new("RGB", (WIDTH, HEIGHT), (255, 255, 255))
+    cursor = ImageDraw.Draw(img)
+
+    for i in range(6):
+        for j in range(5):
+            x = BORDER + j * (SQ + SPACE)
+            y = BORDER + i * (SQ + SPACE)
+            cursor.rectangle((x, y, x + SQ, y + SQ), outline=LGRAY, width=4)
+    return img
+
+
+@functools.lru_cache(maxsize=512)
+def _render_tile(
+    letter: str, color: tuple[int, int, int], text_size: int
+) -> Image.Image:
+    # the tile spans SQ + 1 pixels as PIL rectangles include both end points
+    tile = Image.new("RGB", (SQ + 1, SQ + 1), color)
+    ImageDraw.Draw(tile).text(
+        (SQ / 2, SQ / 2),
+        letter.upper(),
+        font=_load_font(text_size),
+        anchor="mm",
+        fill=(255, 255, 255),
+    )
+    return tile
+
 
 class Guess:
     __slots__ = ("letter", "color")
@@ -42,19 +82,31 @@ class Wordle:
 
     word: str
 
-    def __init__(self, word: Optional[str] = None, *, text_size: int = 55) -> None:
+    def __init__(
+        self,
+        word: Optional[str] = None,
+        *,
+        text_size: int = 55,
+        valid_words: Optional[Union[WordValidator, Iterable[str]]] = None,
+    ) -> None:
         self.embed_color: Optional[DiscordColor] = None
 
-        parent = pathlib.Path(__file__).parent
-        with open(parent / "assets/words.txt", "r") as f:
-            self._valid_words = tuple(f.read().splitlines())
+        if valid_words is None:
+            self.validator = WordValidator(get_lexicon("wordle"), length=5)
+        elif isinstance(valid_words, WordValidator):
+            self.validator = valid_words
+        else:
+            self.validator = WordValidator(valid_words, length=5)
+
+        self._valid_words = self.validator.lexicon
         self._text_size = text_size
-        self._font = ImageFont.truetype(
-            str(parent / "assets/HelveticaNeuBold.ttf"), self._text_size
-        )
+        self._font = _load_font(self._text_size)
 
         self.guesses: list[list[Optional[Guess]]] = []
 
+        self._canvas: Optional[Image.Image] = None
+        self._rendered_rows: int = 0
+
         if word:
             if len(word) != 5:
                 raise ValueError("Word must be of length 5")
@@ -62,9 +114,12 @@ class Wordle:
             if not word.isalpha():
                 raise ValueError("Word must be an alphabetical string")
 
-            self.word = word
+            self.word = word.lower()
         else:
-            self.word = random.choice(self._valid_words)
+            self.word = self._valid_words.random()
+
+    def is_valid_guess(self, guess: str) -> bool:
+        return guess == self.word or self.validator(guess)
 
     def parse_guess(self, guess: str) -> bool:
         assert (guess_len := len(guess)) == len(self.word)
@@ -86,35 +141,21 @@ class Wordle:
 
     @executor()
     def render_image(self) -> BytesIO:
-        with Image.new("RGB", (WIDTH, HEIGHT), (255, 255, 255)) as img:
-            cursor = ImageDraw.Draw(img)
-
-            x = y = BORDER
-            for i in range(6):
-                for j in range(5):
-                    try:
-                        letter = self.guesses[i][j]
-                        assert letter is not None
-                        color = letter.color
-                        literal_letter = letter.letter
-                    except (IndexError, KeyError):
-                        cursor.rectangle((x, y, x + SQ, y + SQ), outline=LGRAY, width=4)
-                    else:
-                        cursor.rectangle((x, y, x + SQ, y + SQ), width=0, fill=color)
-                        cursor.text(
-                            (x + SQ / 2, y + SQ / 2),
-                            literal_letter.upper(),
-                            font=self._font,
-                            anchor="mm",
-                            fill=(255, 255, 255),
-                        )
-
-                    x += SQ + SPACE
-                x = BORDER
-                y += SQ + SPACE
-
-            buf = BytesIO()
-            img.save(buf, "PNG")
+        if self._canvas is None:
+            self._canvas = _blank_board().copy()
+            self._rendered_rows = 0
+
+        # only the rows guessed since the last render need to be drawn
+        for i in range(self._rendered_rows, len(self.guesses)):
+            y = BORDER + i * (SQ + SPACE)
+            for j, letter in enumerate(self.guesses[i]):
+                if letter is not None:
+                    tile = _render_tile(letter.letter, letter.color, self._text_size)
+                    self._canvas.paste(tile, (BORDER + j * (SQ + SPACE), y))
+        self._rendered_rows = len(self.guesses)
+
+        buf = BytesIO()
+        self._canvas.save(buf, "PNG")
         buf.seek(0)
         return buf
 
@@ -162,8 +203,13 @@ class Wordle:
                 )
 
             try:
-                guess: discord.Message = await ctx.bot.wait_for(
-                    "message", timeout=timeout, check=check
+                guess: discord.Message = await GameDispatcher.get(
+                    ctx.bot
+                ).wait_for_message(
+                    channel=ctx.channel.id,
+                    author=ctx.author.id,
+                    check=check,
+                    timeout=timeout,
                 )
             except asyncio.TimeoutError:
                 break
@@ -174,7 +220,7 @@ class Wordle:
                 await ctx.send(f"Game Over! cancelled, the word was: **{self.word}**")
                 break
 
-            if content != self.word and content not in self._valid_words:
+            if not self.is_valid_guess(content):
                 await ctx.send("That is not a valid word!")
             else:
                 won = self.parse_guess(content)
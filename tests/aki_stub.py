@@ -0,0 +1,113 @@
+"""
+A local stand-in for the akinator upstream, replaying the responses in ``aki_responses.json``
+
+Point the games at it with
+``set_akinator_session(AkinatorSession(base_url="http://127.0.0.1:8765"))``
+and run it with ``python -m tests.aki_stub [--delay SECONDS] [--fail-rate RATE]``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+import argparse
+import asyncio
+import json
+import pathlib
+import random
+
+from aiohttp import web
+
+RESPONSES = pathlib.Path(__file__).parent / "aki_responses.json"
+
+
+def question_at(responses: dict[str, Any], step: int) -> dict[str, Any]:
+    questions = responses["questions"]
+    step = min(step, len(questions) - 1)
+    return {
+        "completion": "OK",
+        "akitude": "defi.png",
+        "step": str(step),
+        "progression": str(responses["progressions"][step]),
+        "question_id": str(100 + step),
+        "question": questions[step],
+    }
+
+
+def make_app(
+    responses: dict[str, Any], *, delay: float = 0.0, fail_rate: float = 0.0
+) -> web.Application:
+    """
+    builds the stub application
+
+    Parameters
+    ----------
+    responses : dict[str, Any]
+        the recorded responses to replay
+    delay : float, optional
+        the number of seconds every response is held back for, by default 0.0
+    fail_rate : float, optional
+        the probability of answering with a 503 instead, by default 0.0
+    """
+    last_step = len(responses["questions"]) - 1
+
+    @web.middleware
+    async def upstream_conditions(request: web.Request, handler) -> web.StreamResponse:
+        request.app["requests"] += 1
+        if delay:
+            await asyncio.sleep(delay)
+        if fail_rate and random.random() < fail_rate:
+            return web.Response(status=503, text="Service Unavailable")
+        return await handler(request)
+
+    async def game(_: web.Request) -> web.Response:
+        return web.Response(text=responses["game"], content_type="text/html")
+
+    async def answer(request: web.Request) -> web.Response:
+        step = int((await request.post())["step"])
+        if step + 1 >= last_step:
+            return web.json_response(responses["proposition"])
+        return web.json_response(question_at(responses, step + 1))
+
+    async def cancel_answer(request: web.Request) -> web.Response:
+        step = int((await request.post())["step"])
+        return web.json_response(question_at(responses, max(step - 1, 0)))
+
+    async def exclude(request: web.Request) -> web.Response:
+        step = int((await request.post())["step"])
+        return web.json_response(question_at(responses, step))
+
+    async def choice(_: web.Request) -> web.Response:
+        return web.Response(text=responses["choice"], content_type="text/html")
+
+    app = web.Application(middlewares=[upstream_conditions])
+    app["requests"] = 0
+    app.add_routes(
+        [
+            web.post("/{language}/game", game),
+            web.post("/{language}/answer", answer),
+            web.post("/{language}/cancel_answer", cancel_answer),
+            web.post("/{language}/exclude", exclude),
+            web.post("/{language}/choice", choice),
+        ]
+    )
+    return app
+
+
+def load_responses() -> dict[str, Any]:
+    with open(RESPONSES, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    web.run_app(
+        make_app(load_responses(), delay=args.delay, fail_rate=args.fail_rate),
+        host=args.host,
+        port=args.port,
+    )